@@ -55,4 +55,9 @@
 
 from .version import __version__
 
-from .mil_std_1553 import MILSTD1553Source, MILSTD1553Sink
+from .mil_std_1553 import MILSTD1553Source, MILSTD1553Sink, MILSTD1553Transaction, HDL_SOURCES, get_backend
+from .coverage import MILSTD1553Coverage
+from .profiling import MILSTD1553Profile
+from .traffic import MILSTD1553TrafficGenerator, MILSTD1553TrafficBatch
+from .virtual import VirtualSimulator, VirtualSignal
+from .waveform import decode_waveform, read_capture
@@ -0,0 +1,289 @@
+#******************************************************************************
+# file:    coverage.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# MIL-STD-1553 functional coverage collector
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import itertools
+import struct
+import sys
+import zlib
+
+from array import array
+
+# Variable: FIELDS
+# Command word fields, name mapped to (shift, mask) of the 16 bit command word.
+FIELDS = {
+    "rt_address": (11, 0x1f),
+    "tr":         (10, 0x01),
+    "subaddress": (5,  0x1f),
+    "word_count": (0,  0x1f),
+}
+
+# Variable: ERROR_TYPES
+# Error bins, index into error_hits.
+ERROR_TYPES = ("parity", "sync")
+
+# Variable: ERR_PARITY
+# Index of the parity error bin.
+ERR_PARITY = 0
+
+# Variable: ERR_SYNC
+# Index of the invalid sync error bin.
+ERR_SYNC = 1
+
+# Variable: BROADCAST_ADDRESS
+# RT address reserved for broadcast commands.
+BROADCAST_ADDRESS = 31
+
+# Variable: MODE_CODES
+# Legal mode codes, code mapped to (T/R bit, bc sends a data word, broadcast allowed).
+MODE_CODES = {
+    0:  (1, False, False), # dynamic bus control
+    1:  (1, False, True),  # synchronize
+    2:  (1, False, False), # transmit status word
+    3:  (1, False, True),  # initiate self test
+    4:  (1, False, True),  # transmitter shutdown
+    5:  (1, False, True),  # override transmitter shutdown
+    6:  (1, False, True),  # inhibit terminal flag bit
+    7:  (1, False, True),  # override inhibit terminal flag bit
+    8:  (1, False, True),  # reset remote terminal
+    16: (1, False, False), # transmit vector word
+    17: (0, True,  True),  # synchronize with data word
+    18: (1, False, False), # transmit last command
+    19: (1, False, False), # transmit bit word
+    20: (0, True,  True),  # selected transmitter shutdown
+    21: (0, True,  True),  # override selected transmitter shutdown
+}
+
+_MAGIC = b"M1553COV"
+_VERSION = 1
+_HEADER = struct.Struct("<8sHI")
+_WORDS = 2**16
+
+# Class: MILSTD1553Coverage
+# Functional coverage of the mil-std-1553 command space.
+#
+# Every sampled word increments one counter indexed straight by the 16 bit word,
+# so the cost per word is a single array index. Field, mode code, broadcast and
+# cross coverage are all projections of the command counters computed at report time.
+class MILSTD1553Coverage:
+    # Constructor: __init__
+    # Initialize the object with all bins empty.
+    def __init__(self):
+        # Variable: self.cmd_hits
+        # Hit count for every possible command word.
+        self.cmd_hits = array("Q", bytes(8 * _WORDS))
+
+        # Variable: self.data_hits
+        # Hit count for every possible data word.
+        self.data_hits = array("Q", bytes(8 * _WORDS))
+
+        # Variable: self.error_hits
+        # Hit count for each of ERROR_TYPES.
+        self.error_hits = array("Q", bytes(8 * len(ERROR_TYPES)))
+
+    # Function: sample_cmd
+    # Count a word received with a command sync.
+    def sample_cmd(self, word):
+        self.cmd_hits[word] += 1
+
+    # Function: sample_data
+    # Count a word received with a data sync.
+    def sample_data(self, word):
+        self.data_hits[word] += 1
+
+    # Function: sample_error
+    # Count an error, error is ERR_PARITY or ERR_SYNC.
+    def sample_error(self, error):
+        self.error_hits[error] += 1
+
+    # Function: cross
+    # Return a dict of every bin of the cross of the named FIELDS mapped to its hit count.
+    # mode_code set to True only counts mode commands (subaddress 0 or 31), False excludes them.
+    def cross(self, *fields, mode_code=None):
+        if not fields:
+            raise ValueError("cross needs at least one field")
+
+        specs = []
+        for field in fields:
+            if field not in FIELDS:
+                raise ValueError(f"unknown field {field}, must be one of {list(FIELDS)}")
+            specs.append(FIELDS[field])
+
+        counts = [0] * (1 << (5 * len(specs)))
+
+        for word, hits in enumerate(self.cmd_hits):
+            if not hits:
+                continue
+
+            if mode_code is not None:
+                subaddress = (word >> 5) & 0x1f
+                if (subaddress == 0 or subaddress == 0x1f) != mode_code:
+                    continue
+
+            index = 0
+            for shift, mask in specs:
+                index = (index << 5) | ((word >> shift) & mask)
+            counts[index] += hits
+
+        bins = {}
+        for key in itertools.product(*[range(mask + 1) for shift, mask in specs]):
+            index = 0
+            for value in key:
+                index = (index << 5) | value
+            bins[key] = counts[index]
+
+        return bins
+
+    # Function: coverage
+    # Fraction of the bins of the cross of fields that have been hit.
+    def coverage(self, *fields, mode_code=None):
+        bins = self.cross(*fields, mode_code=mode_code)
+        return sum(1 for hits in bins.values() if hits) / len(bins)
+
+    # Function: mode_codes
+    # Return a dict of every legal mode code in MODE_CODES mapped to its hit count.
+    # Only commands with the T/R bit the code is defined for are counted, reserved codes are not bins.
+    def mode_codes(self):
+        bins = dict.fromkeys(MODE_CODES, 0)
+
+        for (tr, code), hits in self.cross("tr", "word_count", mode_code=True).items():
+            if code in MODE_CODES and MODE_CODES[code][0] == tr:
+                bins[code] += hits
+
+        return bins
+
+    # Function: broadcast
+    # Return a dict of every legal broadcast command mapped to its hit count.
+    # Bins are ("subaddress", 1 to 30) for broadcast receives and ("mode_code", code) for the
+    # mode codes MODE_CODES allows to be broadcast.
+    def broadcast(self):
+        bins = {}
+
+        for subaddress in range(1, 31):
+            bins[("subaddress", subaddress)] = 0
+
+        for code, (tr, has_data, allowed) in MODE_CODES.items():
+            if allowed:
+                bins[("mode_code", code)] = 0
+
+        for word in range(BROADCAST_ADDRESS << 11, _WORDS):
+            hits = self.cmd_hits[word]
+            if not hits:
+                continue
+
+            tr = (word >> 10) & 0x1
+            subaddress = (word >> 5) & 0x1f
+
+            if subaddress == 0 or subaddress == 0x1f:
+                key = ("mode_code", word & 0x1f)
+                if key in bins and MODE_CODES[word & 0x1f][0] == tr:
+                    bins[key] += hits
+            elif not tr:
+                bins[("subaddress", subaddress)] += hits
+
+        return bins
+
+    # Function: report
+    # Return a dict with the coverage of the standard 1553 command groups and error counts.
+    def report(self):
+        mode_codes = self.mode_codes()
+        broadcast = self.broadcast()
+
+        return {
+            "cmd_words": sum(self.cmd_hits),
+            "data_words": sum(self.data_hits),
+            "rt_address": self.coverage("rt_address"),
+            "tr": self.coverage("tr"),
+            "subaddress": self.coverage("subaddress"),
+            "word_count": self.coverage("word_count", mode_code=False),
+            "mode_code": sum(1 for hits in mode_codes.values() if hits) / len(mode_codes),
+            "broadcast": sum(1 for hits in broadcast.values() if hits) / len(broadcast),
+            "cmd_space": sum(1 for hits in self.cmd_hits if hits) / _WORDS,
+            "errors": dict(zip(ERROR_TYPES, self.error_hits)),
+        }
+
+    # Function: merge
+    # Add the hit counts of another coverage object to this one.
+    def merge(self, other):
+        for mine, theirs in ((self.cmd_hits, other.cmd_hits), (self.data_hits, other.data_hits), (self.error_hits, other.error_hits)):
+            for index, hits in enumerate(theirs):
+                if hits:
+                    mine[index] += hits
+        return self
+
+    # Function: save
+    # Write the coverage database to path in the compressed on disk format.
+    def save(self, path):
+        payload = array("Q", self.cmd_hits)
+        payload.extend(self.data_hits)
+        payload.extend(self.error_hits)
+
+        if sys.byteorder == "big":
+            payload.byteswap()
+
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(self.error_hits)))
+            f.write(zlib.compress(payload.tobytes()))
+
+    # Function: load
+    # Create a coverage object from a file written by save.
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            payload = f.read()
+
+        if len(header) != _HEADER.size:
+            raise ValueError(f"{path} is not a version {_VERSION} mil-std-1553 coverage file")
+
+        magic, version, errors = _HEADER.unpack(header)
+
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a version {_VERSION} mil-std-1553 coverage file")
+
+        try:
+            payload = array("Q", zlib.decompress(payload))
+        except zlib.error:
+            raise ValueError(f"{path} is truncated or corrupt") from None
+
+        if sys.byteorder == "big":
+            payload.byteswap()
+
+        if len(payload) != 2 * _WORDS + errors or errors != len(ERROR_TYPES):
+            raise ValueError(f"{path} is truncated or has an unknown error bin layout")
+
+        cov = cls()
+        cov.cmd_hits = payload[:_WORDS]
+        cov.data_hits = payload[_WORDS:2 * _WORDS]
+        cov.error_hits = payload[2 * _WORDS:]
+
+        return cov
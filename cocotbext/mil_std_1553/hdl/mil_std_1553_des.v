@@ -0,0 +1,102 @@
+//******************************************************************************
+// file:    mil_std_1553_des.v
+//
+// author:  JAY CONVERTINO
+//
+// date:    2026/10/19
+//
+// about:   Brief
+// MIL-STD-1553 word deserializer helper for cocotb
+//
+// license: License MIT
+// Copyright 2025 Jay Convertino
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to
+// deal in the Software without restriction, including without limitation the
+// rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+// sell copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//
+//******************************************************************************
+
+`timescale 1ns / 1ns
+
+/*
+ * Module: mil_std_1553_des
+ *
+ * Decode MIL-STD-1553 words for MILSTD1553Sink in hdl mode.
+ *
+ * Words are aligned on the edge in the middle of the sync, the same as
+ * MILSTD1553Sink, and every half bit is sampled in its center. rx_word[19]
+ * toggles each time a word is decoded so the sink needs one edge per word.
+ *
+ * Parameters:
+ *
+ *   HALF_BIT - Half of one bit time in ns, 500 for 1 Mbit
+ *
+ * Ports:
+ *
+ *   data    - Differential mil-std-1553 data
+ *   rx_word - {toggle, parity ok, sync[1:0], word[15:0]}, sync is 01 command, 10 data, 00 invalid
+ */
+module mil_std_1553_des #(
+    parameter HALF_BIT = 500
+  )
+  (
+    input      [1:0]  data,
+    output reg [19:0] rx_word
+  );
+
+  integer     index;
+  reg [1:0]   sync_first;
+  reg [1:0]   sync_second;
+  reg [15:0]  word;
+  reg         parity;
+
+  initial
+  begin
+    rx_word = 20'd0;
+  end
+
+  always
+  begin
+    wait(data === 2'b01 || data === 2'b10);
+
+    #(HALF_BIT);
+    sync_first = data;
+
+    // middle of sync edge
+    @(data);
+    #(HALF_BIT);
+    sync_second = data;
+
+    // center of the first half of bit 15
+    #(HALF_BIT*2 + HALF_BIT/2);
+
+    for(index = 15; index >= 0; index = index - 1)
+    begin
+      word[index] = data[0];
+      #(HALF_BIT*2);
+    end
+
+    parity = data[0];
+
+    rx_word = {~rx_word[19], ^{word, parity}, ((sync_first === ~sync_second) ? sync_first : 2'b00), word};
+
+    // quarter bit past the end of the parity bit
+    #(HALF_BIT*2);
+  end
+
+endmodule
@@ -0,0 +1,105 @@
+//******************************************************************************
+// file:    mil_std_1553_ser.v
+//
+// author:  JAY CONVERTINO
+//
+// date:    2026/10/19
+//
+// about:   Brief
+// MIL-STD-1553 word serializer helper for cocotb
+//
+// license: License MIT
+// Copyright 2025 Jay Convertino
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to
+// deal in the Software without restriction, including without limitation the
+// rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+// sell copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//
+//******************************************************************************
+
+`timescale 1ns / 1ns
+
+/*
+ * Module: mil_std_1553_ser
+ *
+ * Shift out a whole MIL-STD-1553 word written by MILSTD1553Source in hdl mode.
+ *
+ * A word is started by toggling tx_word[17] so it no longer matches tx_ack. The
+ * sync, manchester data bits and odd parity are then driven on data, and tx_ack
+ * toggles to match once the word is done.
+ *
+ * Parameters:
+ *
+ *   HALF_BIT - Half of one bit time in ns, 500 for 1 Mbit
+ *
+ * Ports:
+ *
+ *   tx_word - {toggle, command sync, word[15:0]}
+ *   tx_ack  - Equal to tx_word[17] when idle
+ *   data    - Differential mil-std-1553 data
+ */
+module mil_std_1553_ser #(
+    parameter HALF_BIT = 500
+  )
+  (
+    input      [17:0] tx_word,
+    output reg        tx_ack,
+    output reg [1:0]  data
+  );
+
+  integer     index;
+  reg [15:0]  word;
+  reg         parity;
+
+  initial
+  begin
+    tx_ack = 1'b0;
+    data   = 2'b00;
+  end
+
+  always @(tx_word[17])
+  begin
+    if(tx_word[17] === ~tx_ack)
+    begin
+      word   = tx_word[15:0];
+      parity = ~^tx_word[15:0];
+
+      // command sync is 01 then 10, data sync is 10 then 01, 1.5 bits each
+      data = (tx_word[16] ? 2'b01 : 2'b10);
+      #(HALF_BIT*3);
+      data = (tx_word[16] ? 2'b10 : 2'b01);
+      #(HALF_BIT*3);
+
+      for(index = 15; index >= 0; index = index - 1)
+      begin
+        data = {~word[index], word[index]};
+        #(HALF_BIT);
+        data = {word[index], ~word[index]};
+        #(HALF_BIT);
+      end
+
+      data = {~parity, parity};
+      #(HALF_BIT);
+      data = {parity, ~parity};
+      #(HALF_BIT);
+
+      data   = 2'b00;
+      tx_ack = tx_word[17];
+    end
+  end
+
+endmodule
@@ -55,29 +55,120 @@
 # """
 
 import logging
+import os
+
+from types import SimpleNamespace
 
 import cocotb
 from cocotb.queue import Queue
 from cocotb.binary import BinaryValue
 from cocotb.triggers import FallingEdge, RisingEdge, Timer, First, Event, Edge
+from cocotb.utils import get_sim_time
 
 from manchester_code import encode, decode, decode_bits
 
 from .version import __version__
+from .coverage import ERR_PARITY, ERR_SYNC
+from .profiling import MILSTD1553Profile
+
+# Variable: HDL_SOURCES
+# Verilog helper modules used by the hdl modes of MILSTD1553Source and MILSTD1553Sink
+HDL_SOURCES = [os.path.join(os.path.dirname(__file__), "hdl", name) for name in ("mil_std_1553_ser.v", "mil_std_1553_des.v")]
+
+# Variable: COCOTB_BACKEND
+# Scheduler and triggers of a cocotb simulation, used by any handle without a _backend.
+# A VirtualSignal carries a VirtualSimulator with the same names as its _backend.
+COCOTB_BACKEND = SimpleNamespace(
+    start_soon=cocotb.start_soon,
+    Timer=Timer,
+    Edge=Edge,
+    RisingEdge=RisingEdge,
+    FallingEdge=FallingEdge,
+    First=First,
+    Event=Event,
+    Queue=Queue,
+    get_sim_time=get_sim_time,
+)
+
+# Function: get_backend
+# Return the scheduler and triggers to use with handle.
+def get_backend(handle):
+    return getattr(handle, "_backend", COCOTB_BACKEND)
+
+# Class: MILSTD1553Transaction
+# Completion handle for one word written to a MILSTD1553Source.
+#
+# Await it to wait for that word only, the result is the transaction itself with
+# start_time and end_time in ns. Both stay None if the word was removed by clear.
+class MILSTD1553Transaction:
+    # Constructor: __init__
+    # Initialize the object
+    def __init__(self, sim, sync, data):
+        self._sim = sim
+
+        # Variable: self.sync
+        # CMD_SYNC or DATA_SYNC
+        self.sync = sync
+
+        # Variable: self.data
+        # 2 bytes of the word
+        self.data = data
+
+        # Variable: self.start_time
+        # Sim time in ns the sync started
+        self.start_time = None
+
+        # Variable: self.end_time
+        # Sim time in ns the parity bit ended
+        self.end_time = None
+
+        self._done = False
+        self._event = None
+
+    # Function: done
+    # Has the word been sent or removed from the queue?
+    def done(self):
+        return self._done
+
+    # Function: _complete
+    # Mark the transaction done and wake anything awaiting it
+    def _complete(self, end_time):
+        self.end_time = end_time
+        self._done = True
+        if self._event is not None:
+            self._event.set()
+
+    def __await__(self):
+        if not self._done:
+            # only words someone waits on pay for an event
+            if self._event is None:
+                self._event = self._sim.Event()
+            yield from self._event.wait().__await__()
+        return self
 
 # Class: MILSTD1553Source
 # A mil-std-1553 transmit test routine.
 class MILSTD1553Source:
     # Constructor: __init__
-    # Initialize the object
-    def __init__(self, data, rstn, *args, **kwargs):
+    # Initialize the object, if hdl_ack is the tx_ack of a mil_std_1553_ser then data is its tx_word.
+    # profile turns on MILSTD1553Profile accounting of _run, profile_dir also turns on cProfile.
+    def __init__(self, data, rstn, *args, hdl_ack=None, profile=False, profile_dir=None, **kwargs):
         self.log = logging.getLogger(f"cocotb.{data._path}")
         # Variable: self._data
         # Set internal data connection to 1553 differential bus
         self._data = data
+
+        # Variable: self._sim
+        # Scheduler and triggers for data, cocotb or a VirtualSimulator
+        self._sim = get_backend(data)
+
         #reset
         self._rstn = rstn
 
+        # Variable: self._hdl_ack
+        # mil_std_1553_ser tx_ack, None when driving the bus directly
+        self._hdl_ack = hdl_ack
+
         self.log.info("MIL-STD-1553 source")
         self.log.info("cocotbext-mil_std_1553 version %s", __version__)
         self.log.info("Copyright (c) 2025 Jay Convertino")
@@ -86,21 +177,28 @@ class MILSTD1553Source:
         super().__init__(*args, **kwargs)
 
         self.active = False
-        self.queue = Queue()
+        self.queue = self._sim.Queue()
 
         # Variable: self._base_delay
         # 1 MHz is 1000 nano seconds need half that due to manchester encoding method
-        self._base_delay = Timer(1e3/2, 'ns')
+        self._base_delay = self._sim.Timer(1e3/2, 'ns')
 
         # Variable: self._idle
-        # Event trigger for cocotb
-        self._idle = Event()
+        # Event trigger for cocotb, set once _run empties the queue
+        self._idle = self._sim.Event()
         self._idle.clear()
 
         # Variable: self._data
         # Event trigger for cocotb
         self._data.setimmediatevalue(0)
 
+        # Variable: self.profile
+        # MILSTD1553Profile of _run, None unless profiling was asked for
+        self.profile = None
+
+        if profile or profile_dir is not None:
+            self.profile = MILSTD1553Profile(f"{type(self).__name__}.{data._path}", profile_dir)
+
         # Variable: self._run_cr
         # Thread instance of _run method
         self._run_cr = None
@@ -111,44 +209,83 @@ class MILSTD1553Source:
     def _restart(self):
         if self._run_cr is not None:
             self._run_cr.kill()
-        self._run_cr = cocotb.start_soon(self._run(self._data))
+        if self._hdl_ack is not None:
+            run = self._run_hdl(self._data)
+        else:
+            run = self._run(self._data)
+        if self.profile is not None:
+            run = self.profile.wrap(run)
+        self._run_cr = self._sim.start_soon(run)
 
     # Function: write_cmdSYNTH_PARITY_BITS_PER_TRANS
-    # Write data to send that uses the command sync
+    # Write data to send that uses the command sync, returns its MILSTD1553Transaction once sent.
     async def write_cmd(self, data):
-        if(self._check_type(data)):
-            self.queue.put_nowait(self._cmd_sync)
-            await self.queue.put(data)
-            await self._idle.wait()
-            self._idle.clear()
+        transaction = self.write_nowait_cmd(data)
+        if transaction is not None:
+            await transaction
+        return transaction
 
     # Function: write_data
-    # Write data to send that uses the data sync
+    # Write data to send that uses the data sync, returns its MILSTD1553Transaction once sent.
     async def write_data(self, data):
-        if(self._check_type(data)):
-            self.queue.put_nowait(self._data_sync)
-            await self.queue.put(data)
-            await self._idle.wait()
-            self._idle.clear()
+        transaction = self.write_nowait_data(data)
+        if transaction is not None:
+            await transaction
+        return transaction
 
     # Function: write_nowait_cmd
     # Write data to send that uses command sync but do not wait after writting.
+    # Returns a MILSTD1553Transaction that can be awaited later.
     def write_nowait_cmd(self, data):
         if(self._check_type(data)):
-            self.queue.put_nowait(self._cmd_sync)
-            self.queue.put_nowait(data)
-            self._idle.clear()
+            return self._put(self._cmd_sync, "CMD_SYNC", data)
 
     # Function: write_nowait_data
     # Write data to send that uses data sync but do not wait after writting.
+    # Returns a MILSTD1553Transaction that can be awaited later.
     def write_nowait_data(self, data):
         if(self._check_type(data)):
-            self.queue.put_nowait(self._data_sync)
-            self.queue.put_nowait(data)
-            self._idle.clear()
+            return self._put(self._data_sync, "DATA_SYNC", data)
+
+    # Function: write_words
+    # Write a batch of words, syncs is a matching sequence that is True for command sync words.
+    # Returns the MILSTD1553Transaction of the last word once every word has been sent.
+    async def write_words(self, words, syncs):
+        transaction = self.write_nowait_words(words, syncs)
+        if transaction is not None:
+            await transaction
+        return transaction
+
+    # Function: write_nowait_words
+    # Write a batch of words, syncs is a matching sequence that is True for command sync words.
+    # Works with the words and syncs arrays of a MILSTD1553TrafficBatch.
+    # Returns the MILSTD1553Transaction of the last word, words are sent in order.
+    def write_nowait_words(self, words, syncs):
+        if len(words) != len(syncs):
+            self.log.error(f'WORDS and SYNCS must be the same length')
+            return None
+
+        transaction = None
+
+        for word, is_cmd in zip(words, syncs):
+            word = int(word)
+            if is_cmd:
+                transaction = self._put(self._cmd_sync, "CMD_SYNC", bytes((word & 0xff, word >> 8)))
+            else:
+                transaction = self._put(self._data_sync, "DATA_SYNC", bytes((word & 0xff, word >> 8)))
+
+        return transaction
+
+    # Function: _put
+    # Queue one word with its sync and return its MILSTD1553Transaction
+    def _put(self, sync, sync_name, data):
+        transaction = MILSTD1553Transaction(self._sim, sync_name, data)
+        self.queue.put_nowait((sync, data, transaction))
+        self._idle.clear()
+        return transaction
 
     # Function: count
-    # How many items in the queue
+    # How many words in the queue
     def count(self):
         return self.queue.qsize()
 
@@ -163,10 +300,14 @@ class MILSTD1553Source:
         return self.empty() and not self.active
 
     # Function: clear
-    # Remove all items from queue
+    # Remove all items from queue, their transactions complete without being sent
     def clear(self):
         while not self.queue.empty():
-            frame = self.queue.get_nowait()
+            sync, data, transaction = self.queue.get_nowait()
+            transaction._complete(None)
+
+        if not self.active:
+            self._idle.set()
 
     # Function: _check_type
     # Check and make sure we are only sending 2 bytes at a time and that it is a bytes/bytearray
@@ -219,12 +360,10 @@ class MILSTD1553Source:
 
         while True:
             if not self._rstn.value:
-                await RisingEdge(self._rstn)
+                await self._sim.RisingEdge(self._rstn)
                 continue
                 
-            sync = await self.queue.get()
-
-            out_data = await self.queue.get()
+            sync, out_data, transaction = await self.queue.get()
 
             parity = 1
 
@@ -238,6 +377,8 @@ class MILSTD1553Source:
 
             self.log.info(f'Send {sync.__name__.upper()[1:]} : original word {out_data} : encoded word {encode_out_data} : parity bit {parity}.')
 
+            transaction.start_time = self._sim.get_sim_time('ns')
+
             await sync(data)
 
             # data bits
@@ -253,7 +394,49 @@ class MILSTD1553Source:
             await self._base_delay
             data.value = 0
 
-            self._idle.set()
+            transaction._complete(self._sim.get_sim_time('ns'))
+
+            if self.profile is not None:
+                self.profile.words += 1
+
+            if self.queue.empty():
+                self._idle.set()
+
+            self.active = False
+
+    # Function: _run_hdl
+    # Thread that processing queue and writes each word to a mil_std_1553_ser in one write.
+    async def _run_hdl(self, data):
+        self.active = False
+
+        toggle = 0
+
+        while True:
+            if not self._rstn.value:
+                await self._sim.RisingEdge(self._rstn)
+                continue
+
+            sync, out_data, transaction = await self.queue.get()
+
+            self.active = True
+
+            self.log.info(f'Send {sync.__name__.upper()[1:]} : original word {out_data} : hdl serializer.')
+
+            transaction.start_time = self._sim.get_sim_time('ns')
+
+            toggle ^= 1
+
+            data.value = (toggle << 17) | ((sync == self._cmd_sync) << 16) | (out_data[1] << 8) | out_data[0]
+
+            await self._sim.Edge(self._hdl_ack)
+
+            transaction._complete(self._sim.get_sim_time('ns'))
+
+            if self.profile is not None:
+                self.profile.words += 1
+
+            if self.queue.empty():
+                self._idle.set()
 
             self.active = False
 
@@ -262,15 +445,25 @@ class MILSTD1553Source:
 class MILSTD1553Sink:
 
     # Constructor: __init__
-    # Initialize the object
-    def __init__(self, data, rstn, *args, **kwargs):
+    # Initialize the object, coverage is an optional MILSTD1553Coverage sampled with every received word.
+    # If hdl is True data is the rx_word of a mil_std_1553_des.
+    # profile turns on MILSTD1553Profile accounting of _run, profile_dir also turns on cProfile.
+    def __init__(self, data, rstn, *args, coverage=None, hdl=False, profile=False, profile_dir=None, **kwargs):
         self.log = logging.getLogger(f"cocotb.{data._path}")
         # Variable: self._data
         # Set internal data connection to 1553 differential bus
         self._data = data
+
+        # Variable: self._sim
+        # Scheduler and triggers for data, cocotb or a VirtualSimulator
+        self._sim = get_backend(data)
         
         self._rstn = rstn
 
+        # Variable: self._hdl
+        # Read words from a mil_std_1553_des instead of the bus
+        self._hdl = hdl
+
         self.log.info("MIL-STD-1553 sink")
         self.log.info("cocotbext-mil_std_1553 version %s", __version__)
         self.log.info("Copyright (c) 2025 Jay Convertino")
@@ -279,17 +472,21 @@ class MILSTD1553Sink:
         super().__init__(*args, **kwargs)
 
         self.active = False
-        self.cmd_queue = Queue()
-        self.data_queue = Queue()
-        self.sync = Event()
+        self.cmd_queue = self._sim.Queue()
+        self.data_queue = self._sim.Queue()
+        self.sync = self._sim.Event()
+
+        # Variable: self.coverage
+        # Coverage collector sampled by _run, None to disable
+        self.coverage = coverage
 
         # Variable: self._base_delay
         # 1 MHz is 1000 nano seconds need half that due to manchester decoding method
-        self._base_delay = Timer(1e3/2, 'ns')
+        self._base_delay = self._sim.Timer(1e3/2, 'ns')
 
         # Variable: self._base_delay
         # 1 MHz is 1000 nano seconds need half of half that due to manchester decoding method
-        self._base_delay_half = Timer(1e3/4, 'ns')
+        self._base_delay_half = self._sim.Timer(1e3/4, 'ns')
 
         # Variable: _cmd_sync
         # command sync array value
@@ -299,6 +496,13 @@ class MILSTD1553Sink:
         # data sync array value
         self._data_sync = [BinaryValue("10"), BinaryValue("01")]
 
+        # Variable: self.profile
+        # MILSTD1553Profile of _run, None unless profiling was asked for
+        self.profile = None
+
+        if profile or profile_dir is not None:
+            self.profile = MILSTD1553Profile(f"{type(self).__name__}.{data._path}", profile_dir)
+
         # Variable: self._run_cr
         # Thread instance of _run method
         self._run_cr = None
@@ -309,7 +513,13 @@ class MILSTD1553Sink:
     def _restart(self):
         if self._run_cr is not None:
             self._run_cr.kill()
-        self._run_cr = cocotb.start_soon(self._run(self._data))
+        if self._hdl:
+            run = self._run_hdl(self._data)
+        else:
+            run = self._run(self._data)
+        if self.profile is not None:
+            run = self.profile.wrap(run)
+        self._run_cr = self._sim.start_soon(run)
 
     # Function: read_cmd
     # Read any data that was identified with a command sync
@@ -378,23 +588,23 @@ class MILSTD1553Sink:
 
     # Function: wait_cmd
     # Wait for command data
-    async def wait_cmd(self, timeout=0, timeout_unit='nsreg_data'):
+    async def wait_cmd(self, timeout=0, timeout_unit='ns'):
         if not self.empty_cmd():
             return
         self.sync.clear()
         if timeout:
-            await First(self.sync.wait(), Timer(timeout, timeout_unit))
+            await self._sim.First(self.sync.wait(), self._sim.Timer(timeout, timeout_unit))
         else:
             await self.sync.wait()
 
     # Function: wait_data
     # Wait for data data.
-    async def wait_data(self, timeout=0, timeout_unit='nsreg_data'):
+    async def wait_data(self, timeout=0, timeout_unit='ns'):
         if not self.empty_data():
             return
         self.sync.clear()
         if timeout:
-            await First(self.sync.wait(), Timer(timeout, timeout_unit))
+            await self._sim.First(self.sync.wait(), self._sim.Timer(timeout, timeout_unit))
         else:
             await self.sync.wait()
 
@@ -412,10 +622,10 @@ class MILSTD1553Sink:
             parity = 0
             
             if not self._rstn.value:
-                await RisingEdge(self._rstn)
+                await self._sim.RisingEdge(self._rstn)
 
             if(data.value[0] == data.value[1]):
-                await Edge(data)
+                await self._sim.Edge(data)
 
             if(data.value[0] == data.value[1]):
                 self.log.info("false trigger, data values equal")
@@ -431,7 +641,7 @@ class MILSTD1553Sink:
 
             sync_value.append(data.value)
 
-            await Edge(data)
+            await self._sim.Edge(data)
 
             await self._base_delay
 
@@ -460,20 +670,83 @@ class MILSTD1553Sink:
                 for x in range(8):
                     parity ^= (byte >> x) & 1
 
-            if(parity != 1):
-                self.log.error(f'Parity Check Failed')
-
             if(sync_value == self._cmd_sync):
                 sync_value = "CMD_SYNC"
-                self.cmd_queue.put_nowait(in_data)
             elif(sync_value == self._data_sync):
                 sync_value = "DATA_SYNC"
-                self.data_queue.put_nowait(in_data)
             else:
                 sync_value = "INVALID"
 
             self.log.info(f'Recv {sync_value}, original word {decode_in_data} : decoded word {in_data} : parity bit {org_parity}.')
 
-            self.sync.set()
+            self._receive(sync_value, in_data, parity == 1)
 
             self.active = False
+
+    # Function: _run_hdl
+    # Thread that reads each decoded word from a mil_std_1553_des and puts it in the proper command or data queue.
+    async def _run_hdl(self, data):
+        self.active = False
+
+        sync_names = ["INVALID", "CMD_SYNC", "DATA_SYNC", "INVALID"]
+
+        toggle = 0
+
+        while True:
+            if not self._rstn.value:
+                await self._sim.RisingEdge(self._rstn)
+
+            await self._sim.Edge(data)
+
+            value = data.value
+
+            if not value.is_resolvable:
+                self.log.info("Invalid data bit")
+                continue
+
+            value = value.integer
+
+            # only a change of the toggle bit is a new word
+            if (value >> 19) == toggle:
+                continue
+
+            toggle ^= 1
+
+            self.active = True
+
+            in_data = bytes(((value & 0xff), ((value >> 8) & 0xff)))
+
+            sync_value = sync_names[(value >> 16) & 3]
+
+            self.log.info(f'Recv {sync_value}, decoded word {in_data} : hdl deserializer.')
+
+            self._receive(sync_value, in_data, (value >> 18) & 1)
+
+            self.active = False
+
+    # Function: _receive
+    # Put a decoded word in the queue matching its sync, sample coverage and wake any readers.
+    def _receive(self, sync_value, in_data, parity_ok):
+        coverage = self.coverage
+
+        if not parity_ok:
+            self.log.error(f'Parity Check Failed')
+
+        if(sync_value == "CMD_SYNC"):
+            self.cmd_queue.put_nowait(in_data)
+            if coverage is not None:
+                coverage.sample_cmd(in_data[0] | (in_data[1] << 8))
+        elif(sync_value == "DATA_SYNC"):
+            self.data_queue.put_nowait(in_data)
+            if coverage is not None:
+                coverage.sample_data(in_data[0] | (in_data[1] << 8))
+        elif coverage is not None:
+            coverage.sample_error(ERR_SYNC)
+
+        if not parity_ok and coverage is not None:
+            coverage.sample_error(ERR_PARITY)
+
+        if self.profile is not None:
+            self.profile.words += 1
+
+        self.sync.set()
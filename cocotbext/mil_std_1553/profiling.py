@@ -0,0 +1,184 @@
+#******************************************************************************
+# file:    profiling.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# MIL-STD-1553 opt-in profiling of the source/sink run threads
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import atexit
+import collections
+import cProfile
+import logging
+import os
+import re
+import time
+
+# profiles not dumped yet, written by _dump_all at exit if the test never called dump.
+# Held strongly so a profile outlives its BFM, which is usually collected when its test ends.
+_pending = set()
+
+# Class: MILSTD1553Profile
+# Trigger and wall clock accounting for one source or sink _run thread.
+#
+# Every trigger the thread awaits is counted by type, in _run an Event is a queue get.
+# The wall clock time from a resume to the next await is added to the trigger that
+# resumed it, which is the python overhead of the thread. With profile_dir set each
+# resume also runs under cProfile. Call dump at the end of the test to log the report and write
+# the stats, profiles never dumped are written once at interpreter exit.
+class MILSTD1553Profile:
+    # Constructor: __init__
+    # Initialize the object, name is used for the log and the cProfile file name.
+    def __init__(self, name, profile_dir=None):
+        self.log = logging.getLogger(f"cocotb.{name}")
+
+        # Variable: self.name
+        # Name of the profiled instance
+        self.name = name
+
+        # Variable: self.words
+        # Words sent or received by the instance
+        self.words = 0
+
+        # Variable: self.triggers
+        # Count of each trigger type awaited
+        self.triggers = collections.Counter()
+
+        # Variable: self.busy_time
+        # Wall clock seconds spent running after each trigger type fired
+        self.busy_time = collections.defaultdict(float)
+
+        # Variable: self.path
+        # cProfile stats file, None if cProfile is off
+        self.path = None
+
+        self._cprofile = None
+
+        if profile_dir is not None:
+            os.makedirs(profile_dir, exist_ok=True)
+            self.path = os.path.join(profile_dir, re.sub(r"[^\w.-]", "_", name) + ".prof")
+            self._cprofile = cProfile.Profile()
+
+        _pending.add(self)
+
+    # Function: wrap
+    # Return a coroutine that runs coro with accounting, for start_soon.
+    async def wrap(self, coro):
+        return await _Profiled(self, coro)
+
+    # Function: report
+    # Return a dict of the trigger counts and wall clock time, total and per word.
+    def report(self):
+        words = max(self.words, 1)
+        resumes = sum(self.triggers.values())
+        busy = sum(self.busy_time.values())
+
+        return {
+            "name": self.name,
+            "words": self.words,
+            "triggers": dict(self.triggers),
+            "busy_time": dict(self.busy_time),
+            "triggers_per_word": resumes / words,
+            "busy_time_per_word": busy / words,
+        }
+
+    # Function: dump
+    # Log the report and write the cProfile stats if enabled.
+    def dump(self):
+        _pending.discard(self)
+
+        self.log.info(f'Profile {self.report()}')
+
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(self.path)
+            self.log.info(f'Profile cProfile stats written to {self.path}')
+
+# Function: _dump_all
+# Dump every profile that has not been dumped.
+def _dump_all():
+    for profile in list(_pending):
+        profile.dump()
+
+atexit.register(_dump_all)
+
+# Class: _Profiled
+# Awaitable that steps a coroutine, accounting for every trigger it yields.
+class _Profiled:
+    def __init__(self, profile, coro):
+        self._profile = profile
+        self._coro = coro
+
+    def __await__(self):
+        coro = self._coro
+        profile = self._profile
+        cprofile = profile._cprofile
+        triggers = profile.triggers
+        busy_time = profile.busy_time
+        names = {}
+
+        resumed_by = "start"
+        value = None
+        error = None
+
+        try:
+            while True:
+                start = time.perf_counter()
+
+                if cprofile is not None:
+                    cprofile.enable()
+
+                try:
+                    if error is None:
+                        trigger = coro.send(value)
+                    else:
+                        trigger = coro.throw(error)
+                except StopIteration as e:
+                    return e.value
+                finally:
+                    if cprofile is not None:
+                        cprofile.disable()
+
+                    busy_time[resumed_by] += time.perf_counter() - start
+
+                name = names.get(type(trigger))
+                if name is None:
+                    name = names[type(trigger)] = type(trigger).__name__.lstrip("_")
+
+                triggers[name] += 1
+                resumed_by = name
+
+                try:
+                    value = yield trigger
+                    error = None
+                except GeneratorExit:
+                    raise
+                except BaseException as e:
+                    value = None
+                    error = e
+        finally:
+            coro.close()
@@ -0,0 +1,203 @@
+#******************************************************************************
+# file:    traffic.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# MIL-STD-1553 constrained random traffic generator
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import numpy as np
+
+from .coverage import BROADCAST_ADDRESS, MODE_CODES
+
+# Variable: MESSAGE_TYPES
+# Message formats the generator can produce, index is the value stored in msg_types.
+MESSAGE_TYPES = ("bc_rt", "rt_bc", "rt_rt", "mode_code", "broadcast", "broadcast_mode_code")
+
+MSG_BC_RT = 0
+MSG_RT_BC = 1
+MSG_RT_RT = 2
+MSG_MODE_CODE = 3
+MSG_BROADCAST = 4
+MSG_BROADCAST_MODE_CODE = 5
+
+# Class: MILSTD1553TrafficBatch
+# A batch of generated bus controller words, ready for MILSTD1553Source.write_words.
+class MILSTD1553TrafficBatch:
+    # Constructor: __init__
+    # Initialize the object
+    def __init__(self, words, syncs, msg_types, msg_offsets):
+        # Variable: self.words
+        # uint16 array of every word in transmit order
+        self.words = words
+
+        # Variable: self.syncs
+        # bool array, True if the word at the same index uses a command sync
+        self.syncs = syncs
+
+        # Variable: self.msg_types
+        # uint8 array with the index into MESSAGE_TYPES of each message
+        self.msg_types = msg_types
+
+        # Variable: self.msg_offsets
+        # index into words of the first word of each message
+        self.msg_offsets = msg_offsets
+
+    # Function: __len__
+    # Number of messages in the batch
+    def __len__(self):
+        return len(self.msg_types)
+
+# Class: MILSTD1553TrafficGenerator
+# Seeded constrained random generator of legal bus controller message sequences.
+#
+# Whole batches are built with numpy array operations, no python object is created per word.
+class MILSTD1553TrafficGenerator:
+    # Constructor: __init__
+    # Initialize the object, weights is a dict of MESSAGE_TYPES names to relative weight.
+    def __init__(self, seed=None, weights=None, rt_addresses=range(31), subaddresses=range(1, 31), word_counts=range(1, 33), mode_codes=MODE_CODES.keys()):
+        self._rng = np.random.default_rng(seed)
+
+        if weights is None:
+            weights = dict.fromkeys(MESSAGE_TYPES, 1)
+
+        for name in weights:
+            if name not in MESSAGE_TYPES:
+                raise ValueError(f"unknown message type {name}, must be one of {MESSAGE_TYPES}")
+
+        weight = np.array([weights.get(name, 0) for name in MESSAGE_TYPES], dtype=np.float64)
+
+        if weight.sum() <= 0 or (weight < 0).any():
+            raise ValueError("weights must be positive with at least one non zero")
+
+        self._weights = weight / weight.sum()
+
+        self._rt_addresses = np.array(sorted(set(rt_addresses)), dtype=np.uint16)
+        self._subaddresses = np.array(sorted(set(subaddresses)), dtype=np.uint16)
+        self._word_counts = np.array(sorted(set(word_counts)), dtype=np.uint16)
+
+        if not len(self._rt_addresses) or self._rt_addresses.max() >= BROADCAST_ADDRESS:
+            raise ValueError("rt_addresses must be a non empty set of 0 to 30")
+
+        if not len(self._subaddresses) or self._subaddresses.min() < 1 or self._subaddresses.max() > 30:
+            raise ValueError("subaddresses must be a non empty set of 1 to 30")
+
+        if not len(self._word_counts) or self._word_counts.min() < 1 or self._word_counts.max() > 32:
+            raise ValueError("word_counts must be a non empty set of 1 to 32")
+
+        if self._weights[MSG_RT_RT] and len(self._rt_addresses) < 2:
+            raise ValueError("rt_rt messages need at least two rt_addresses")
+
+        codes = sorted(set(mode_codes))
+
+        for code in codes:
+            if code not in MODE_CODES:
+                raise ValueError(f"mode code {code} is reserved or out of range")
+
+        self._mode_codes = np.array(codes, dtype=np.uint16)
+        self._broadcast_mode_codes = np.array([code for code in codes if MODE_CODES[code][2]], dtype=np.uint16)
+
+        if (self._weights[MSG_MODE_CODE] and not len(self._mode_codes)) or (self._weights[MSG_BROADCAST_MODE_CODE] and not len(self._broadcast_mode_codes)):
+            raise ValueError("mode code messages need at least one legal mode code")
+
+        # lookup tables indexed by mode code
+        self._mode_tr = np.zeros(32, dtype=np.uint16)
+        self._mode_data = np.zeros(32, dtype=np.int64)
+
+        for code, (tr, has_data, broadcast) in MODE_CODES.items():
+            self._mode_tr[code] = tr
+            self._mode_data[code] = has_data
+
+    # Function: generate
+    # Generate a MILSTD1553TrafficBatch of count messages.
+    def generate(self, count):
+        rng = self._rng
+
+        msg_types = rng.choice(len(MESSAGE_TYPES), size=count, p=self._weights).astype(np.uint8)
+
+        is_rt_rt = msg_types == MSG_RT_RT
+        is_broadcast = (msg_types == MSG_BROADCAST) | (msg_types == MSG_BROADCAST_MODE_CODE)
+        is_mode = (msg_types == MSG_MODE_CODE) | (msg_types == MSG_BROADCAST_MODE_CODE)
+
+        rt_index = rng.integers(0, len(self._rt_addresses), size=count)
+        rt = self._rt_addresses[rt_index]
+        rt[is_broadcast] = BROADCAST_ADDRESS
+
+        subaddress = rng.choice(self._subaddresses, size=count)
+        word_count = rng.choice(self._word_counts, size=count)
+
+        tr = (msg_types == MSG_RT_BC).astype(np.uint16)
+
+        # mode codes use subaddress 0 or 31 and carry the code in the word count field
+        mode_code = np.zeros(count, dtype=np.uint16)
+
+        if len(self._mode_codes):
+            mode_code = np.where(msg_types == MSG_MODE_CODE, rng.choice(self._mode_codes, size=count), mode_code)
+
+        if len(self._broadcast_mode_codes):
+            mode_code = np.where(msg_types == MSG_BROADCAST_MODE_CODE, rng.choice(self._broadcast_mode_codes, size=count), mode_code)
+
+        subaddress = np.where(is_mode, rng.integers(0, 2, size=count, dtype=np.uint16) * 31, subaddress)
+        field = np.where(is_mode, mode_code, word_count & 0x1f)
+        tr = np.where(is_mode, self._mode_tr[mode_code], tr)
+
+        cmd = (rt << 11) | (tr << 10) | (subaddress << 5) | field
+
+        # rt to rt is a receive command followed by a transmit command to a different rt
+        offset = rng.integers(1, max(len(self._rt_addresses), 2), size=count)
+        rt_tx = self._rt_addresses[(rt_index + offset) % len(self._rt_addresses)]
+        subaddress_tx = rng.choice(self._subaddresses, size=count)
+        cmd_tx = (rt_tx << 11) | (1 << 10) | (subaddress_tx << 5) | (word_count & 0x1f)
+
+        data_count = np.where((msg_types == MSG_BC_RT) | (msg_types == MSG_BROADCAST), word_count.astype(np.int64), 0)
+        data_count = np.where(is_mode, self._mode_data[mode_code], data_count)
+
+        length = 1 + is_rt_rt + data_count
+        msg_offsets = np.zeros(count, dtype=np.int64)
+        np.cumsum(length[:-1], out=msg_offsets[1:])
+
+        total = int(length.sum())
+
+        syncs = np.zeros(total, dtype=bool)
+        syncs[msg_offsets] = True
+        syncs[msg_offsets[is_rt_rt] + 1] = True
+
+        words = np.empty(total, dtype=np.uint16)
+        words[msg_offsets] = cmd
+        words[msg_offsets[is_rt_rt] + 1] = cmd_tx[is_rt_rt]
+        words[~syncs] = rng.integers(0, 2**16, size=total - int(syncs.sum()), dtype=np.uint16)
+
+        return MILSTD1553TrafficBatch(words, syncs, msg_types, msg_offsets)
+
+    # Function: batches
+    # Yield batches of at most batch_size messages until count messages have been generated.
+    def batches(self, count, batch_size=2**16):
+        while count > 0:
+            size = min(count, batch_size)
+            count -= size
+            yield self.generate(size)
@@ -0,0 +1,515 @@
+#******************************************************************************
+# file:    virtual.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# MIL-STD-1553 pure python virtual bus for simulator free tests
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import collections
+import heapq
+import itertools
+
+from cocotb.binary import BinaryValue
+from cocotb.queue import QueueEmpty, QueueFull
+
+# Variable: _UNITS
+# Time units to the integer picosecond steps of the virtual simulator
+_UNITS = {"step": 1, "fs": 1e-3, "ps": 1, "ns": 1e3, "us": 1e6, "ms": 1e9, "sec": 1e12}
+
+_EDGE = 0
+_RISING = 1
+_FALLING = 2
+
+# Function: _steps
+# Convert time in units to integer simulator steps
+def _steps(time, units):
+    if units not in _UNITS:
+        raise ValueError(f"unknown time unit {units}, must be one of {list(_UNITS)}")
+    return int(round(time * _UNITS[units]))
+
+# Class: _Trigger
+# Base of everything a coroutine can await in the virtual simulator.
+#
+# Subclasses define _prime(callback), which arranges for callback(trigger) to be called
+# when the trigger fires and returns a function that removes the callback again.
+class _Trigger:
+    # Function: __await__
+    # Hand the trigger to the scheduler, resume with the trigger that fired.
+    def __await__(self):
+        return (yield self)
+
+# Class: _Timer
+# Fires a fixed number of steps after being awaited.
+class _Timer(_Trigger):
+    def __init__(self, sim, steps):
+        self._sim = sim
+        self._steps = steps
+
+    def _prime(self, callback):
+        entry = self._sim._call_at(self._sim._now + self._steps, lambda: callback(self))
+
+        def cancel():
+            entry[2] = None
+
+        return cancel
+
+# Class: _Edge
+# Fires on a value change of a VirtualSignal, kind selects any, rising or falling.
+class _Edge(_Trigger):
+    def __init__(self, signal, kind=_EDGE):
+        self._signal = signal
+        self._kind = kind
+
+    def _prime(self, callback):
+        return _add_waiter(self._signal._waiters, (self._kind, lambda: callback(self)))
+
+# Class: _RisingEdge
+# Fires when bit 0 of a VirtualSignal goes to 1.
+class _RisingEdge(_Edge):
+    def __init__(self, signal):
+        super().__init__(signal, _RISING)
+
+# Class: _FallingEdge
+# Fires when bit 0 of a VirtualSignal goes to 0.
+class _FallingEdge(_Edge):
+    def __init__(self, signal):
+        super().__init__(signal, _FALLING)
+
+# Class: _First
+# Fires with whichever of its triggers fires first.
+class _First(_Trigger):
+    def __init__(self, triggers):
+        self._triggers = triggers
+
+    def _prime(self, callback):
+        cancels = []
+
+        def cancel():
+            for cancel_trigger in cancels:
+                cancel_trigger()
+            cancels.clear()
+
+        def first(trigger):
+            # the losers would otherwise stay in their signal and event waiter lists
+            if cancels:
+                cancel()
+                callback(trigger)
+
+        for trigger in self._triggers:
+            cancels.append(trigger._prime(first))
+
+        return cancel
+
+# Class: _Event
+# Fires once its event is set.
+class _Event(_Trigger):
+    def __init__(self, event):
+        self._event = event
+
+    def _prime(self, callback):
+        if self._event._set:
+            return _call_soon_cancellable(self._event._sim, lambda: callback(self))
+        return _add_waiter(self._event._waiters, lambda: callback(self))
+
+# Class: _Join
+# Fires once its task is done.
+class _Join(_Trigger):
+    def __init__(self, task):
+        self._task = task
+
+    def _prime(self, callback):
+        if self._task._done:
+            return _call_soon_cancellable(self._task._sim, lambda: callback(self))
+        return _add_waiter(self._task._waiters, lambda: callback(self))
+
+# Function: _add_waiter
+# Append waiter to waiters, return a function that removes it if it is still waiting.
+def _add_waiter(waiters, waiter):
+    waiters.append(waiter)
+
+    def cancel():
+        # the list is swapped out when waiters are woken, identity is all that matters
+        for index, item in enumerate(waiters):
+            if item is waiter:
+                del waiters[index]
+                return
+
+    return cancel
+
+# Function: _call_soon_cancellable
+# Call callback in the current time step unless the returned function is called first.
+def _call_soon_cancellable(sim, callback):
+    cancelled = []
+
+    def call():
+        if not cancelled:
+            callback()
+
+    sim._call_soon(call)
+
+    return lambda: cancelled.append(True)
+
+# Class: VirtualEvent
+# Event with the same methods as a cocotb Event.
+class VirtualEvent:
+    def __init__(self, sim, name=None):
+        self._sim = sim
+        self._set = False
+        self._waiters = []
+        self.name = name
+        self.data = None
+
+    # Function: set
+    # Set the event and wake all waiting coroutines.
+    def set(self, data=None):
+        self._set = True
+        self.data = data
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            self._sim._call_soon(waiter)
+
+    # Function: clear
+    # Clear the event, wait will block until the next set.
+    def clear(self):
+        self._set = False
+
+    # Function: is_set
+    # Is the event set?
+    def is_set(self):
+        return self._set
+
+    # Function: wait
+    # Return a trigger that fires once the event is set.
+    def wait(self):
+        return _Event(self)
+
+# Class: VirtualQueue
+# Queue with the same methods as a cocotb Queue.
+class VirtualQueue:
+    def __init__(self, sim, maxsize=0):
+        self._sim = sim
+        self._maxsize = maxsize
+        self._queue = collections.deque()
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+
+    def qsize(self):
+        return len(self._queue)
+
+    def empty(self):
+        return not self._queue
+
+    def full(self):
+        return self._maxsize > 0 and len(self._queue) >= self._maxsize
+
+    def put_nowait(self, item):
+        if self.full():
+            raise QueueFull()
+        self._queue.append(item)
+        if self._getters:
+            self._getters.popleft().set()
+
+    def get_nowait(self):
+        if not self._queue:
+            raise QueueEmpty()
+        item = self._queue.popleft()
+        if self._putters:
+            self._putters.popleft().set()
+        return item
+
+    async def put(self, item):
+        while self.full():
+            event = VirtualEvent(self._sim)
+            self._putters.append(event)
+            await event.wait()
+        self.put_nowait(item)
+
+    async def get(self):
+        while self.empty():
+            event = VirtualEvent(self._sim)
+            self._getters.append(event)
+            await event.wait()
+        return self.get_nowait()
+
+# Class: VirtualTask
+# A coroutine running in a VirtualSimulator, returned by start_soon.
+class VirtualTask:
+    def __init__(self, sim, coro):
+        self._sim = sim
+        self._coro = coro
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._waiters = []
+        self._wait_id = 0
+
+    # Function: done
+    # Has the coroutine returned, raised or been killed?
+    def done(self):
+        return self._done
+
+    # Function: result
+    # Return value of the coroutine, raises what the coroutine raised.
+    def result(self):
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    # Function: kill
+    # Stop the coroutine, it will not be resumed again.
+    def kill(self):
+        if not self._done:
+            self._coro.close()
+            self._finish(None, None)
+
+    # Function: join
+    # Return a trigger that fires once the task is done.
+    def join(self):
+        return _Join(self)
+
+    def __await__(self):
+        if not self._done:
+            yield _Join(self)
+        return self.result()
+
+    def _finish(self, result, exception):
+        self._done = True
+        self._result = result
+        self._exception = exception
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            self._sim._call_soon(waiter)
+
+    def _resume(self, wait_id, value):
+        if self._done or wait_id != self._wait_id:
+            return
+        self._wait_id += 1
+        error = None
+        while True:
+            try:
+                if error is None:
+                    trigger = self._coro.send(value)
+                else:
+                    trigger = self._coro.throw(error)
+            except StopIteration as e:
+                self._finish(e.value, None)
+                return
+            except BaseException as e:
+                self._finish(None, e)
+                raise
+            if isinstance(trigger, _Trigger):
+                break
+            # raised at the await so the traceback points at the model
+            error = TypeError(f"{trigger!r} is not a VirtualSimulator trigger, models run on the "
+                              "virtual bus must take their triggers from get_backend(handle)")
+        wait_id = self._wait_id
+        trigger._prime(lambda fired: self._resume(wait_id, fired))
+
+# Class: VirtualSignal
+# A signal handle of a VirtualSimulator, used in place of a cocotb handle such as dut.data.
+#
+# Like cocotb, a write with .value lands at the end of the current time step so
+# every coroutine resumed in that step reads the old value.
+class VirtualSignal:
+    def __init__(self, sim, name, width=1, value=0):
+        self._backend = sim
+        self._path = name
+        self._name = name
+        self._width = width
+        self._value = self._convert(value)
+        self._waiters = []
+
+    # Function: value
+    # Current value as a BinaryValue, writes are applied at the end of the time step.
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._backend._writes[self] = self._convert(value)
+
+    # Function: setimmediatevalue
+    # Write value now instead of at the end of the time step.
+    def setimmediatevalue(self, value):
+        self._set(self._convert(value))
+
+    def _convert(self, value):
+        if isinstance(value, BinaryValue):
+            value = value.binstr
+        if isinstance(value, str):
+            return BinaryValue(value, n_bits=self._width, bigEndian=False)
+        return BinaryValue(int(value), n_bits=self._width, bigEndian=False)
+
+    def _set(self, value):
+        old = self._value.binstr
+        new = value.binstr
+        self._value = value
+
+        if old == new or not self._waiters:
+            return
+
+        rising = old[-1] != "1" and new[-1] == "1"
+        falling = old[-1] != "0" and new[-1] == "0"
+
+        waiters, self._waiters = self._waiters, []
+
+        for kind, callback in waiters:
+            if kind == _EDGE or (kind == _RISING and rising) or (kind == _FALLING and falling):
+                self._backend._call_soon(callback)
+            else:
+                self._waiters.append((kind, callback))
+
+# Class: VirtualSimulator
+# Event driven scheduler and virtual signals to run MILSTD1553Source, MILSTD1553Sink
+# and other models without an HDL simulator.
+#
+# The scheduler and trigger names match COCOTB_BACKEND, so a model that takes
+# its triggers from get_backend(handle) runs on either. Awaiting a cocotb trigger,
+# such as cocotb.triggers.Timer, in the virtual simulator raises a TypeError.
+class VirtualSimulator:
+    # Constructor: __init__
+    # Initialize the object at time 0
+    def __init__(self):
+        self._now = 0
+        self._seq = itertools.count()
+        self._timers = []
+        self._ready = collections.deque()
+        self._writes = {}
+
+    # Function: signal
+    # Create a VirtualSignal of width bits
+    def signal(self, name, width=1, value=0):
+        return VirtualSignal(self, name, width, value)
+
+    # Function: start_soon
+    # Schedule a coroutine to start in the current time step, returns a VirtualTask
+    def start_soon(self, coro):
+        task = VirtualTask(self, coro)
+        self._call_soon(lambda: task._resume(0, None))
+        return task
+
+    # Function: Timer
+    # Trigger that fires time units after being awaited
+    def Timer(self, time, units="step"):
+        return _Timer(self, _steps(time, units))
+
+    # Function: Edge
+    # Trigger that fires on any change of signal
+    def Edge(self, signal):
+        return _Edge(signal, _EDGE)
+
+    # Function: RisingEdge
+    # Trigger that fires when bit 0 of signal goes to 1
+    def RisingEdge(self, signal):
+        return _RisingEdge(signal)
+
+    # Function: FallingEdge
+    # Trigger that fires when bit 0 of signal goes to 0
+    def FallingEdge(self, signal):
+        return _FallingEdge(signal)
+
+    # Function: First
+    # Trigger that fires with the first of triggers
+    def First(self, *triggers):
+        return _First(triggers)
+
+    # Function: Event
+    # Create a VirtualEvent
+    def Event(self, name=None):
+        return VirtualEvent(self, name)
+
+    # Function: Queue
+    # Create a VirtualQueue
+    def Queue(self, maxsize=0):
+        return VirtualQueue(self, maxsize)
+
+    # Function: get_sim_time
+    # Current simulation time in units
+    def get_sim_time(self, units="step"):
+        if units not in _UNITS:
+            raise ValueError(f"unknown time unit {units}, must be one of {list(_UNITS)}")
+        if units == "step":
+            return self._now
+        return self._now / _UNITS[units]
+
+    # Function: run
+    # Run until nothing is scheduled, or for time units if given.
+    def run(self, time=None, units="ns"):
+        end = None if time is None else self._now + _steps(time, units)
+        self._run(end, None)
+
+    # Function: run_until_complete
+    # Run coro as a task until it returns, and return its result.
+    def run_until_complete(self, coro):
+        task = self.start_soon(coro)
+        self._run(None, task)
+        if not task.done():
+            raise RuntimeError("simulation stalled before the coroutine returned, nothing left scheduled")
+        return task.result()
+
+    def _call_soon(self, callback):
+        self._ready.append(callback)
+
+    # Returns the heap entry, setting its callback to None cancels it.
+    def _call_at(self, steps, callback):
+        entry = [steps, next(self._seq), callback]
+        heapq.heappush(self._timers, entry)
+        return entry
+
+    def _settle(self):
+        ready = self._ready
+        while ready or self._writes:
+            while ready:
+                ready.popleft()()
+            writes, self._writes = self._writes, {}
+            for signal, value in writes.items():
+                signal._set(value)
+
+    def _run(self, end, task):
+        timers = self._timers
+
+        while True:
+            self._settle()
+
+            if task is not None and task.done():
+                return
+
+            if not timers or (end is not None and timers[0][0] > end):
+                break
+
+            self._now = timers[0][0]
+
+            while timers and timers[0][0] == self._now:
+                callback = heapq.heappop(timers)[2]
+                if callback is not None:
+                    self._ready.append(callback)
+
+        if end is not None:
+            self._now = end
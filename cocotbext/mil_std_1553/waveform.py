@@ -0,0 +1,395 @@
+#******************************************************************************
+# file:    waveform.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# MIL-STD-1553 offline decoder for VCD/FST waveform dumps
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import argparse
+import os
+import re
+import struct
+import subprocess
+import sys
+
+import numpy as np
+
+# Variable: CAPTURE_DTYPE
+# Record of one decoded word in a capture, time is the start of the sync in ps.
+# sync is 1 for command, 2 for data and 0 for invalid, the same as mil_std_1553_des.
+CAPTURE_DTYPE = np.dtype([
+    ("time", "<i8"),
+    ("word", "<u2"),
+    ("sync", "u1"),
+    ("parity_ok", "u1"),
+    ("manchester_ok", "u1"),
+])
+
+SYNC_INVALID = 0
+SYNC_CMD = 1
+SYNC_DATA = 2
+
+_CAPTURE_MAGIC = b"M1553CAP"
+_CAPTURE_VERSION = 1
+_CAPTURE_HEADER = struct.Struct("<8sH")
+
+# Variable: HALF_BIT
+# Half of one 1 Mbit bit time in ps
+HALF_BIT = 500000
+
+# a level must last this long to be half of a sync, manchester levels last at most 2 half bits
+_SYNC_MIN = 5 * HALF_BIT // 2
+
+# mid sync edge to the end of the parity bit
+_WORD_END = 37 * HALF_BIT
+
+# changes kept between chunks so a word split over chunks is decoded once it is complete
+_CARRY = 42 * HALF_BIT
+
+# center of the first half of each data bit and the parity bit, from the mid sync edge
+_FIRST_HALF = 3 * HALF_BIT + 2 * HALF_BIT * np.arange(17, dtype=np.int64) + HALF_BIT // 2
+
+_SHIFTS = np.arange(15, -1, -1, dtype=np.uint16)
+
+_TIMESCALE = {b"s": 10**12, b"ms": 10**9, b"us": 10**6, b"ns": 10**3, b"ps": 1, b"fs": 1}
+
+_VALUES = {b"00": 0, b"01": 1, b"10": 2, b"11": 3, b"0": 0, b"1": 1}
+
+# Function: write_capture_header
+# Write the capture header to an open binary file, records follow as CAPTURE_DTYPE.
+def write_capture_header(f):
+    f.write(_CAPTURE_HEADER.pack(_CAPTURE_MAGIC, _CAPTURE_VERSION))
+
+# Function: read_capture
+# Read a capture file into a CAPTURE_DTYPE array.
+def read_capture(path):
+    with open(path, "rb") as f:
+        magic, version = _CAPTURE_HEADER.unpack(f.read(_CAPTURE_HEADER.size))
+
+    if magic != _CAPTURE_MAGIC or version != _CAPTURE_VERSION:
+        raise ValueError(f"{path} is not a version {_CAPTURE_VERSION} mil-std-1553 capture file")
+
+    return np.fromfile(path, dtype=CAPTURE_DTYPE, offset=_CAPTURE_HEADER.size)
+
+# Function: _open_dump
+# Open a VCD file, or pipe an FST file through fst2vcd, as a binary stream.
+def _open_dump(path):
+    if not path.endswith(".fst"):
+        return open(path, "rb"), None
+
+    try:
+        proc = subprocess.Popen(["fst2vcd", path], stdout=subprocess.PIPE)
+    except FileNotFoundError:
+        raise RuntimeError("fst2vcd from gtkwave is needed to read FST dumps") from None
+
+    return proc.stdout, proc
+
+# Function: _read_header
+# Parse the VCD header, return the id code of signal and the timescale in ps as (num, den).
+def _read_header(f, signal):
+    lines = []
+    for line in f:
+        lines.append(line)
+        if b"$enddefinitions" in line:
+            break
+
+    tokens = b" ".join(lines).split()
+
+    scope = []
+    matches = []
+    timescale = (1, 1)
+
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+
+        if token == b"$scope":
+            scope.append(tokens[index + 2].decode())
+            index += 3
+        elif token == b"$upscope":
+            scope.pop()
+            index += 1
+        elif token == b"$var":
+            code = tokens[index + 3]
+            path = ".".join(scope + [tokens[index + 4].decode()])
+            if path == signal or path.endswith("." + signal):
+                matches.append((path, code))
+            index += 5
+        elif token == b"$timescale":
+            text = b"".join(tokens[index + 1:tokens.index(b"$end", index)])
+            number = re.match(rb"(\d+)([a-z]+)", text)
+            if number is None or number.group(2) not in _TIMESCALE:
+                raise ValueError(f"unknown timescale {text.decode()}")
+            scale = int(number.group(1)) * _TIMESCALE[number.group(2)]
+            timescale = (scale, 1000) if number.group(2) == b"fs" else (scale, 1)
+            index += 1
+        else:
+            index += 1
+
+    if not matches:
+        raise ValueError(f"no signal named {signal} in the dump")
+
+    # an exact hierarchical name wins, else the shallowest matches, ports of instances below
+    # the bus carry the same trailing name on other nets
+    exact = [match for match in matches if match[0] == signal]
+    if exact:
+        matches = exact
+    else:
+        depth = min(path.count(".") for path, code in matches)
+        matches = [match for match in matches if match[0].count(".") == depth]
+
+    codes = set(code for path, code in matches)
+
+    if len(codes) > 1:
+        raise ValueError(f"signal {signal} is ambiguous, matches {[path for path, code in matches]}")
+
+    return codes.pop(), timescale
+
+# Function: iter_changes
+# Stream the value changes of signal out of a VCD or FST dump.
+# Yields (times, values, known) per block, times in ps, values are the 2 bit bus or -1 for x/z,
+# and the bus value is known up to the time known.
+#
+# Timestamp lines and lines ending in the bus id code are found with numpy. Only the bus changes
+# are parsed in python, each is mapped to the timestamp before it with searchsorted and only
+# those timestamps are converted, so clocks and other signals in the dump cost no python work.
+def iter_changes(path, signal="data", block_size=2**26):
+    f, proc = _open_dump(path)
+
+    try:
+        code, (num, den) = _read_header(f, signal)
+
+        suffix = np.frombuffer(code, dtype=np.uint8)
+
+        code = re.escape(code)
+        pattern = re.compile(rb"b([01xzXZ]+)[ \t]+" + code + rb"\r?|([01xzXZ])" + code + rb"\r?")
+
+        now = 0
+        tail = b""
+
+        while True:
+            block = f.read(block_size)
+
+            if block:
+                block = tail + block
+                split = block.rfind(b"\n") + 1
+                block, tail = block[:split], block[split:]
+            elif tail:
+                block, tail = tail + b"\n", b""
+            else:
+                break
+
+            if not block:
+                continue
+
+            buffer = np.frombuffer(block, dtype=np.uint8)
+
+            # every line ends in a newline, a timestamp line starts with #
+            newlines = np.flatnonzero(buffer == ord("\n"))
+            starts = np.concatenate(([0], newlines[:-1] + 1))
+            stamps = starts[buffer[starts] == ord("#")]
+            stamp_ends = newlines[np.searchsorted(newlines, stamps)]
+
+            # value change lines of the bus end in its id code, only those go through the regex
+            ends = newlines - (buffer[np.maximum(newlines - 1, 0)] == ord("\r"))
+            candidates = ends - len(suffix) > starts
+
+            for position, byte in enumerate(suffix.tolist()):
+                candidates &= buffer[np.maximum(ends - len(suffix) + position, 0)] == byte
+
+            offsets = []
+            values = []
+
+            for start, end in zip(starts[candidates].tolist(), newlines[candidates].tolist()):
+                match = pattern.fullmatch(block, start, end)
+
+                if match is not None:
+                    vector, scalar = match.groups()
+
+                    offsets.append(start)
+                    # vcd drops leading zeros of vectors, anything with x or z is -1
+                    values.append(_VALUES.get(vector if vector is not None else scalar, -1))
+
+            # index of the timestamp before each change, -1 is the last timestamp of the previous block,
+            # which is kept in the extra last entry of lookup
+            index = np.searchsorted(stamps, np.array(offsets, dtype=np.int64), side="right") - 1
+
+            lookup = np.full(len(stamps) + 1, now, dtype=np.int64)
+
+            needed = np.unique(index)
+            needed = needed[needed >= 0]
+
+            if len(stamps):
+                needed = np.append(needed, len(stamps) - 1)
+
+            for i in needed.tolist():
+                lookup[i] = int(block[stamps[i] + 1:stamp_ends[i]]) * num // den
+
+            times = lookup[index]
+
+            if len(stamps):
+                now = int(lookup[len(stamps) - 1])
+
+            yield times, np.array(values, dtype=np.int8), now
+    finally:
+        f.close()
+        if proc is not None:
+            proc.wait()
+
+# Function: decode_changes
+# Decode every complete word in arrays of bus change times and values, vectorised over all words.
+# Words are aligned on the edge in the middle of the sync like MILSTD1553Sink and each half bit
+# is sampled in its center. Only sync edges after the time after are decoded.
+# Returns (CAPTURE_DTYPE records, time of the last decoded sync edge).
+def decode_changes(times, values, known, after=-1):
+    records = np.zeros(0, dtype=CAPTURE_DTYPE)
+
+    if not len(times):
+        return records, after
+
+    # last value at each time, then merge repeated values into single levels
+    keep = np.append(times[1:] != times[:-1], True)
+    times, values = times[keep], values[keep]
+    keep = np.append(True, values[1:] != values[:-1])
+    times, values = times[keep], values[keep]
+
+    if len(times) < 2:
+        return records, after
+
+    length = np.empty(len(times), dtype=np.int64)
+    length[:-1] = np.diff(times)
+    length[-1] = known - times[-1]
+
+    prev = values[:-1]
+    cur = values[1:]
+
+    # a sync is two opposite levels of 1.5 bits each, nothing else on the bus lasts over 1 bit
+    edges = np.flatnonzero(((prev == 1) | (prev == 2)) & (cur == 3 - prev) & (length[:-1] >= _SYNC_MIN) & (length[1:] >= _SYNC_MIN)) + 1
+    edge_times = times[edges]
+    edge_times = edge_times[(edge_times > after) & (edge_times + _WORD_END <= known)]
+
+    if not len(edge_times):
+        return records, after
+
+    first_at = edge_times[:, None] + _FIRST_HALF[None, :]
+    first = values[np.searchsorted(times, first_at, side="right") - 1]
+    second = values[np.searchsorted(times, first_at + HALF_BIT, side="right") - 1]
+
+    sync_first = values[np.searchsorted(times, edge_times - 3 * HALF_BIT // 2, side="right") - 1]
+    sync_second = values[np.searchsorted(times, edge_times + 3 * HALF_BIT // 2, side="right") - 1]
+
+    bits = (first & 1).astype(np.uint16)
+
+    records = np.zeros(len(edge_times), dtype=CAPTURE_DTYPE)
+    records["time"] = edge_times - 3 * HALF_BIT
+    records["word"] = (bits[:, :16] << _SHIFTS).sum(axis=1, dtype=np.uint16)
+    records["sync"] = np.where(((sync_first == 1) | (sync_first == 2)) & (sync_second == 3 - sync_first), sync_first, SYNC_INVALID)
+    records["parity_ok"] = bits.sum(axis=1) & 1
+    records["manchester_ok"] = (((first == 1) | (first == 2)) & (second == 3 - first)).all(axis=1)
+
+    return records, int(edge_times[-1])
+
+# Function: iter_decode
+# Decode a VCD or FST dump chunk by chunk, yields CAPTURE_DTYPE arrays so dumps larger than memory can be decoded.
+def iter_decode(path, signal="data", block_size=2**26):
+    carry_times = np.zeros(0, dtype=np.int64)
+    carry_values = np.zeros(0, dtype=np.int8)
+    after = -1
+
+    for times, values, known in iter_changes(path, signal, block_size):
+        times = np.concatenate((carry_times, times))
+        values = np.concatenate((carry_values, values))
+
+        # a block with no bus changes, only clocks or other signals
+        if not len(times):
+            continue
+
+        records, after = decode_changes(times, values, known, after)
+
+        if len(records):
+            yield records
+
+        start = max(int(np.searchsorted(times, known - _CARRY)) - 1, 0)
+        carry_times, carry_values = times[start:], values[start:]
+
+# Function: decode_waveform
+# Decode a VCD or FST dump, returns the CAPTURE_DTYPE records, or writes them to output
+# in the capture format and returns the number of words if output is given.
+def decode_waveform(path, signal="data", output=None, block_size=2**26):
+    if output is None:
+        chunks = list(iter_decode(path, signal, block_size))
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=CAPTURE_DTYPE)
+
+    count = 0
+
+    with open(output, "wb") as f:
+        write_capture_header(f)
+
+        for records in iter_decode(path, signal, block_size):
+            records.tofile(f)
+            count += len(records)
+
+    return count
+
+# Function: main
+# Command line decode of a dump to a capture file.
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Decode MIL-STD-1553 words from a VCD or FST waveform dump.")
+    parser.add_argument("dump", help="VCD or FST file, FST needs fst2vcd")
+    parser.add_argument("-s", "--signal", default="data", help="hierarchical name or trailing name of the 2 bit bus, the shallowest match is used (default: data)")
+    parser.add_argument("-o", "--output", help="capture file to write (default: dump name with .m1553cap)")
+    parser.add_argument("--block-size", type=int, default=2**26, help="bytes of dump parsed per chunk")
+    args = parser.parse_args(argv)
+
+    output = args.output or os.path.splitext(args.dump)[0] + ".m1553cap"
+
+    # words, command, data, invalid sync, parity errors, manchester errors
+    totals = np.zeros(6, dtype=np.int64)
+
+    try:
+        with open(output, "wb") as f:
+            write_capture_header(f)
+
+            for records in iter_decode(args.dump, args.signal, args.block_size):
+                records.tofile(f)
+                totals += (len(records), (records["sync"] == SYNC_CMD).sum(), (records["sync"] == SYNC_DATA).sum(), (records["sync"] == SYNC_INVALID).sum(),
+                           (records["parity_ok"] == 0).sum(), (records["manchester_ok"] == 0).sum())
+    except (OSError, RuntimeError, ValueError) as e:
+        if os.path.exists(output):
+            os.remove(output)
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{totals[0]} words : {totals[1]} command : {totals[2]} data : {totals[3]} invalid sync : "
+          f"{totals[4]} parity errors : {totals[5]} manchester errors : written to {output}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
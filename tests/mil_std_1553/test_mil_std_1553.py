@@ -67,11 +67,11 @@ from cocotb.triggers import Timer
 from cocotb.regression import TestFactory
 
 try:
-    from cocotbext.mil_std_1553 import MILSTD1553Source, MILSTD1553Sink
+    from cocotbext.mil_std_1553 import MILSTD1553Source, MILSTD1553Sink, MILSTD1553Coverage, MILSTD1553TrafficGenerator, HDL_SOURCES
 except ImportError as e:
     import sys
     sys.path.append("../../")
-    from cocotbext.mil_std_1553 import MILSTD1553Source, MILSTD1553Sink
+    from cocotbext.mil_std_1553 import MILSTD1553Source, MILSTD1553Sink, MILSTD1553Coverage, MILSTD1553TrafficGenerator, HDL_SOURCES
 
 # Class: TB
 # Create the device under test which is the source/sink.
@@ -82,8 +82,10 @@ class TB:
         self.log = logging.getLogger("cocotb.tb")
         self.log.setLevel(logging.DEBUG)
 
+        self.coverage = MILSTD1553Coverage()
+
         self.source  = MILSTD1553Source(dut.data, dut.arstn)
-        self.sink = MILSTD1553Sink(dut.data, dut.arstn)
+        self.sink = MILSTD1553Sink(dut.data, dut.arstn, coverage=self.coverage)
 
 
 # Function: run_test
@@ -116,6 +118,122 @@ async def run_test(dut, payload_data=None):
 
         await Timer(10, 'us')
 
+# Function: run_traffic_test
+# Tests the source/sink with constrained random 1553 message traffic.
+async def run_traffic_test(dut, seed=None):
+
+    tb = TB(dut)
+
+    dut.arstn.value = 1
+
+    await Timer(10, 'us')
+
+    batch = MILSTD1553TrafficGenerator(seed=seed).generate(256)
+
+    tb.log.info(f'TEST SEED : {seed} : MESSAGES : {len(batch)} : WORDS : {len(batch.words)}')
+
+    await tb.source.write_words(batch.words, batch.syncs)
+
+    for word, is_cmd in zip(batch.words.tolist(), batch.syncs.tolist()):
+
+        data = word.to_bytes(2, byteorder="little")
+
+        if is_cmd:
+            rx_data = await tb.sink.read_cmd()
+
+            assert data == rx_data, "RECEIVED CMD DOES NOT MATCH"
+        else:
+            rx_data = await tb.sink.read_data()
+
+            assert data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    report = tb.coverage.report()
+
+    tb.log.info(f'COVERAGE : {report}')
+
+    assert report["cmd_words"] == int(batch.syncs.sum()), "COVERAGE CMD WORD COUNT DOES NOT MATCH"
+
+# Function: run_hdl_test
+# Tests the hdl mode source/sink through the mil_std_1553_ser/mil_std_1553_des helpers.
+async def run_hdl_test(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    source = MILSTD1553Source(dut.tx_word, dut.arstn, hdl_ack=dut.tx_ack)
+    sink = MILSTD1553Sink(dut.rx_word, dut.arstn, coverage=tb.coverage, hdl=True)
+
+    dut.arstn.value = 1
+
+    await Timer(10, 'us')
+
+    payload = payload_data()
+
+    for test_data in payload:
+
+        data = test_data.to_bytes(2, byteorder="little")
+
+        source.write_nowait_cmd(data)
+
+        source.write_nowait_data(data)
+
+        rx_data = await sink.read_cmd()
+
+        assert data == rx_data, "RECEIVED CMD DOES NOT MATCH"
+
+        rx_data = await sink.read_data()
+
+        assert data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    report = tb.coverage.report()
+
+    assert report["cmd_words"] == len(payload), "COVERAGE CMD WORD COUNT DOES NOT MATCH"
+    assert not any(report["errors"].values()), "COVERAGE RECORDED ERRORS"
+
+# Function: run_hdl_bus_test
+# Tests the mil_std_1553_ser/mil_std_1553_des helpers against the bus mode source/sink.
+# mil_std_1553_ser drives a bus mode sink and a bus mode source drives mil_std_1553_des.
+async def run_hdl_bus_test(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    hdl_source = MILSTD1553Source(dut.tx_word, dut.arstn, hdl_ack=dut.tx_ack)
+    bus_sink = MILSTD1553Sink(dut.ser_data, dut.arstn)
+
+    bus_source = MILSTD1553Source(dut.des_data, dut.arstn)
+    hdl_sink = MILSTD1553Sink(dut.des_rx_word, dut.arstn, hdl=True)
+
+    dut.arstn.value = 1
+
+    await Timer(10, 'us')
+
+    for test_data in payload_data():
+
+        data = test_data.to_bytes(2, byteorder="little")
+
+        hdl_source.write_nowait_cmd(data)
+
+        hdl_source.write_nowait_data(data)
+
+        bus_source.write_nowait_cmd(data)
+
+        bus_source.write_nowait_data(data)
+
+        rx_data = await bus_sink.read_cmd()
+
+        assert data == rx_data, "BUS SINK RECEIVED CMD DOES NOT MATCH"
+
+        rx_data = await bus_sink.read_data()
+
+        assert data == rx_data, "BUS SINK RECEIVED DATA DOES NOT MATCH"
+
+        rx_data = await hdl_sink.read_cmd()
+
+        assert data == rx_data, "HDL SINK RECEIVED CMD DOES NOT MATCH"
+
+        rx_data = await hdl_sink.read_data()
+
+        assert data == rx_data, "HDL SINK RECEIVED DATA DOES NOT MATCH"
+
 # Function: incrementing_payload
 # Generate a list of ints that increment from 0 to 2^16
 def incrementing_payload():
@@ -134,6 +252,18 @@ if cocotb.SIM_NAME:
     factory.add_option("payload_data", [incrementing_payload, random_payload])
     factory.generate_tests()
 
+    factory = TestFactory(run_hdl_test)
+    factory.add_option("payload_data", [incrementing_payload, random_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_hdl_bus_test)
+    factory.add_option("payload_data", [incrementing_payload, random_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_traffic_test)
+    factory.add_option("seed", [1553, 2025])
+    factory.generate_tests()
+
 
 # cocotb-test
 tests_dir = os.path.dirname(__file__)
@@ -147,10 +277,16 @@ def test_mil_std_1553(request):
 
     verilog_sources = [
         os.path.join(tests_dir, f"{dut}.v"),
-    ]
+    ] + HDL_SOURCES
 
     parameters = {}
 
+    compile_args = []
+
+    # mil_std_1553_ser/des use # delays
+    if os.getenv("SIM") == "verilator":
+        compile_args += ["--timing"]
+
     extra_env = {f'PARAM_{k}': str(v) for k, v in parameters.items()}
 
     sim_build = os.path.join(tests_dir, "sim_build",
@@ -162,6 +298,7 @@ def test_mil_std_1553(request):
         toplevel=toplevel,
         module=module,
         parameters=parameters,
+        compile_args=compile_args,
         sim_build=sim_build,
         extra_env=extra_env,
     )
@@ -63,14 +63,52 @@
  *
  * Ports:
  *
- *   data - Differential mil-std-1553 data
+ *   data    - Differential mil-std-1553 data
+ *   arstn   - Negative reset
+ *   tx_word - mil_std_1553_ser word input for the hdl mode source
+ *   tx_ack  - mil_std_1553_ser word done
+ *   rx_word - mil_std_1553_des decoded word for the hdl mode sink
+ *   ser_data    - mil_std_1553_ser bus output for a bus mode sink
+ *   des_data    - Bus input from a bus mode source to the second mil_std_1553_des
+ *   des_rx_word - Second mil_std_1553_des decoded word for the hdl mode sink
  */
 module test_mil_std_1553
 (
-    inout  [1:0] data,
-    inout        arstn
+    inout  [1:0]  data,
+    inout         arstn,
+    input  [17:0] tx_word,
+    output        tx_ack,
+    output [19:0] rx_word,
+    output [1:0]  ser_data,
+    input  [1:0]  des_data,
+    output [19:0] des_rx_word
 );
 
+  wire [1:0] hdl_data;
+
+  //hdl helper loop
+  mil_std_1553_ser inst_mil_std_1553_ser
+  (
+    .tx_word(tx_word),
+    .tx_ack(tx_ack),
+    .data(hdl_data)
+  );
+
+  mil_std_1553_des inst_mil_std_1553_des
+  (
+    .data(hdl_data),
+    .rx_word(rx_word)
+  );
+
+  //hdl helpers against the bus mode source/sink
+  assign ser_data = hdl_data;
+
+  mil_std_1553_des inst_bus_mil_std_1553_des
+  (
+    .data(des_data),
+    .rx_word(des_rx_word)
+  );
+
   //copy pasta, fst generation
   initial
   begin
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+#******************************************************************************
+# file:    test_mil_std_1553_coverage.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# Simulator free tests of the mil-std-1553 coverage collector
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import pytest
+
+try:
+    from cocotbext.mil_std_1553 import MILSTD1553Coverage, MILSTD1553TrafficGenerator
+    from cocotbext.mil_std_1553.coverage import ERR_PARITY
+except ImportError as e:
+    import sys
+    sys.path.append("../../")
+    from cocotbext.mil_std_1553 import MILSTD1553Coverage, MILSTD1553TrafficGenerator
+    from cocotbext.mil_std_1553.coverage import ERR_PARITY
+
+# Function: command
+# Build a command word from its fields.
+def command(rt_address, tr, subaddress, word_count):
+    return (rt_address << 11) | (tr << 10) | (subaddress << 5) | word_count
+
+# Function: test_coverage_cross
+# Tests cross bins count the commands with each field combination.
+def test_coverage_cross():
+    cov = MILSTD1553Coverage()
+
+    cov.sample_cmd(command(5, 0, 3, 4))
+    cov.sample_cmd(command(5, 1, 3, 7))
+    cov.sample_cmd(command(6, 0, 0, 2))
+
+    bins = cov.cross("rt_address", "subaddress")
+
+    assert len(bins) == 32 * 32
+    assert bins[(5, 3)] == 2
+    assert bins[(6, 0)] == 1
+    assert sum(bins.values()) == 3
+
+    assert cov.cross("rt_address", mode_code=True)[(6,)] == 1
+    assert cov.cross("rt_address", mode_code=False)[(6,)] == 0
+
+    assert cov.coverage("tr") == 1.0
+
+    with pytest.raises(ValueError):
+        cov.cross("status")
+
+# Function: test_coverage_closure
+# Tests mode code and broadcast coverage close on legal generated traffic.
+def test_coverage_closure():
+    cov = MILSTD1553Coverage()
+
+    batch = MILSTD1553TrafficGenerator(seed=1553, weights={"mode_code": 1, "broadcast": 1, "broadcast_mode_code": 1}).generate(10000)
+
+    for word in batch.words[batch.syncs].tolist():
+        cov.sample_cmd(word)
+
+    report = cov.report()
+
+    assert report["mode_code"] == 1.0
+    assert report["broadcast"] == 1.0
+
+    # reserved mode codes are not bins
+    cov = MILSTD1553Coverage()
+    cov.sample_cmd(command(1, 0, 0, 0))
+
+    assert not any(cov.mode_codes().values())
+
+# Function: test_coverage_merge
+# Tests merge adds the hit counts of parallel runs.
+def test_coverage_merge():
+    first = MILSTD1553Coverage()
+    second = MILSTD1553Coverage()
+
+    first.sample_cmd(0x1234)
+    first.sample_data(0xabcd)
+    second.sample_cmd(0x1234)
+    second.sample_cmd(0x4321)
+    second.sample_error(ERR_PARITY)
+
+    first.merge(second)
+
+    assert first.cmd_hits[0x1234] == 2
+    assert first.cmd_hits[0x4321] == 1
+    assert first.data_hits[0xabcd] == 1
+    assert first.report()["errors"] == {"parity": 1, "sync": 0}
+
+# Function: test_coverage_save_load
+# Tests a coverage database round trips through the on disk format.
+def test_coverage_save_load(tmp_path):
+    cov = MILSTD1553Coverage()
+
+    for word in range(0, 2**16, 7):
+        cov.sample_cmd(word)
+        cov.sample_data(word ^ 0xffff)
+
+    cov.sample_error(ERR_PARITY)
+
+    path = str(tmp_path / "cov.m1553")
+
+    cov.save(path)
+
+    loaded = MILSTD1553Coverage.load(path)
+
+    assert loaded.cmd_hits == cov.cmd_hits
+    assert loaded.data_hits == cov.data_hits
+    assert loaded.error_hits == cov.error_hits
+    assert loaded.report() == cov.report()
+
+# Function: test_coverage_load_invalid
+# Tests load rejects a bad header and a truncated file.
+def test_coverage_load_invalid(tmp_path):
+    path = str(tmp_path / "cov.m1553")
+
+    MILSTD1553Coverage().save(path)
+
+    with open(path, "rb") as f:
+        contents = f.read()
+
+    with open(path, "wb") as f:
+        f.write(b"NOTACOV!" + contents[8:])
+
+    with pytest.raises(ValueError):
+        MILSTD1553Coverage.load(path)
+
+    with open(path, "wb") as f:
+        f.write(contents[:len(contents) // 2])
+
+    with pytest.raises(ValueError):
+        MILSTD1553Coverage.load(path)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+#******************************************************************************
+# file:    test_mil_std_1553_traffic.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# Simulator free tests of the mil-std-1553 traffic generator
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import numpy as np
+import pytest
+
+try:
+    from cocotbext.mil_std_1553 import MILSTD1553TrafficGenerator
+    from cocotbext.mil_std_1553.traffic import MODE_CODES, MSG_BC_RT, MSG_RT_BC, MSG_RT_RT, MSG_MODE_CODE, MSG_BROADCAST, MSG_BROADCAST_MODE_CODE
+except ImportError as e:
+    import sys
+    sys.path.append("../../")
+    from cocotbext.mil_std_1553 import MILSTD1553TrafficGenerator
+    from cocotbext.mil_std_1553.traffic import MODE_CODES, MSG_BC_RT, MSG_RT_BC, MSG_RT_RT, MSG_MODE_CODE, MSG_BROADCAST, MSG_BROADCAST_MODE_CODE
+
+# Function: messages
+# Split a batch into (message type, list of words, list of syncs) per message.
+def messages(batch):
+    ends = list(batch.msg_offsets[1:]) + [len(batch.words)]
+
+    for msg_type, start, end in zip(batch.msg_types.tolist(), batch.msg_offsets.tolist(), ends):
+        yield msg_type, batch.words[start:end].tolist(), batch.syncs[start:end].tolist()
+
+# Function: test_traffic_seed
+# Tests the same seed gives the same traffic and another seed does not.
+def test_traffic_seed():
+    first = MILSTD1553TrafficGenerator(seed=1553).generate(1000)
+    second = MILSTD1553TrafficGenerator(seed=1553).generate(1000)
+    other = MILSTD1553TrafficGenerator(seed=2025).generate(1000)
+
+    assert np.array_equal(first.words, second.words)
+    assert np.array_equal(first.syncs, second.syncs)
+    assert np.array_equal(first.msg_types, second.msg_types)
+    assert not np.array_equal(first.words[:len(other.words)], other.words[:len(first.words)])
+
+# Function: test_traffic_messages
+# Tests every generated message is a legal 1553 message of its type.
+def test_traffic_messages():
+    batch = MILSTD1553TrafficGenerator(seed=1553).generate(5000)
+
+    assert set(batch.msg_types.tolist()) == set(range(6))
+
+    for msg_type, words, syncs in messages(batch):
+        cmd = words[0]
+        rt = cmd >> 11
+        tr = (cmd >> 10) & 0x1
+        subaddress = (cmd >> 5) & 0x1f
+        field = cmd & 0x1f
+
+        count = field if field else 32
+
+        assert syncs[0]
+
+        if msg_type in (MSG_BROADCAST, MSG_BROADCAST_MODE_CODE):
+            assert rt == 31, "BROADCAST DOES NOT USE RT 31"
+        else:
+            assert rt != 31, "NON BROADCAST USES RT 31"
+
+        if msg_type in (MSG_MODE_CODE, MSG_BROADCAST_MODE_CODE):
+            assert subaddress in (0, 31), "MODE CODE DOES NOT USE SUBADDRESS 0 OR 31"
+            assert field in MODE_CODES and MODE_CODES[field][0] == tr
+            assert len(words) == 1 + MODE_CODES[field][1]
+            assert not any(syncs[1:])
+
+            if msg_type == MSG_BROADCAST_MODE_CODE:
+                assert MODE_CODES[field][2]
+            continue
+
+        assert subaddress not in (0, 31)
+
+        if msg_type == MSG_RT_RT:
+            tx = words[1]
+
+            assert syncs[1] and len(words) == 2
+            assert tr == 0 and (tx >> 10) & 0x1 == 1, "RT TO RT IS NOT RECEIVE THEN TRANSMIT"
+            assert tx >> 11 != rt, "RT TO RT USES THE SAME RT"
+            assert tx & 0x1f == field, "RT TO RT WORD COUNTS DIFFER"
+        elif msg_type == MSG_RT_BC:
+            assert tr == 1 and len(words) == 1
+        else:
+            assert tr == 0
+            assert len(words) == 1 + count, "DATA WORDS DO NOT MATCH THE WORD COUNT"
+            assert not any(syncs[1:])
+
+# Function: test_traffic_batches
+# Tests batches split the message count.
+def test_traffic_batches():
+    sizes = [len(batch) for batch in MILSTD1553TrafficGenerator(seed=1553).batches(1000, batch_size=300)]
+
+    assert sizes == [300, 300, 300, 100]
+
+# Function: test_traffic_invalid
+# Tests bad generator settings are rejected.
+def test_traffic_invalid():
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(weights={"bogus": 1})
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(weights={"bc_rt": 0})
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(weights={"bc_rt": -1, "rt_bc": 2})
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(rt_addresses=[31])
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(rt_addresses=[])
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(rt_addresses=[5])
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(subaddresses=[0])
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(word_counts=[33])
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(mode_codes=[9])
+
+    with pytest.raises(ValueError):
+        MILSTD1553TrafficGenerator(weights={"broadcast_mode_code": 1}, mode_codes=[0, 2])
+
+    # a single rt is fine without rt to rt traffic
+    assert len(MILSTD1553TrafficGenerator(rt_addresses=[5], weights={"bc_rt": 1}).generate(10)) == 10
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+#******************************************************************************
+# file:    test_mil_std_1553_virtual.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# Simulator free tests of mil-std-1553 source/sink on the virtual bus
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import gc
+import logging
+import os
+import random
+
+import pytest
+
+from cocotb.triggers import NullTrigger
+
+try:
+    from cocotbext.mil_std_1553 import MILSTD1553Source, MILSTD1553Sink, MILSTD1553Coverage, MILSTD1553TrafficGenerator
+    from cocotbext.mil_std_1553.virtual import VirtualSimulator
+    from cocotbext.mil_std_1553 import profiling
+except ImportError as e:
+    import sys
+    sys.path.append("../../")
+    from cocotbext.mil_std_1553 import MILSTD1553Source, MILSTD1553Sink, MILSTD1553Coverage, MILSTD1553TrafficGenerator
+    from cocotbext.mil_std_1553.virtual import VirtualSimulator
+    from cocotbext.mil_std_1553 import profiling
+
+# Class: TB
+# Create the source/sink on a virtual bus.
+class TB:
+    def __init__(self):
+        self.sim = VirtualSimulator()
+
+        self.log = logging.getLogger("cocotb.tb")
+        self.log.setLevel(logging.DEBUG)
+
+        self.data = self.sim.signal("data", 2)
+        self.arstn = self.sim.signal("arstn", 1, 1)
+
+        self.coverage = MILSTD1553Coverage()
+
+        self.source  = MILSTD1553Source(self.data, self.arstn)
+        self.sink = MILSTD1553Sink(self.data, self.arstn, coverage=self.coverage)
+
+# Function: test_virtual_loopback
+# Tests the source/sink for valid transmission of data without a simulator.
+def test_virtual_loopback():
+    tb = TB()
+
+    payload = random.Random(1553).sample(range(2**16), 256)
+
+    async def run():
+        await tb.sim.Timer(10, 'us')
+
+        for test_data in payload:
+
+            data = test_data.to_bytes(2, byteorder="little")
+
+            await tb.source.write_cmd(data)
+
+            await tb.source.write_data(data)
+
+            assert data == await tb.sink.read_cmd(), "RECEIVED CMD DOES NOT MATCH"
+
+            assert data == await tb.sink.read_data(), "RECEIVED DATA DOES NOT MATCH"
+
+    tb.sim.run_until_complete(run())
+
+    report = tb.coverage.report()
+
+    assert report["cmd_words"] == len(payload)
+    assert report["data_words"] == len(payload)
+    assert not any(report["errors"].values())
+
+# Function: test_virtual_traffic
+# Tests a constrained random traffic batch sent back to back.
+def test_virtual_traffic():
+    tb = TB()
+
+    batch = MILSTD1553TrafficGenerator(seed=1553).generate(64)
+
+    async def run():
+        await tb.source.write_words(batch.words, batch.syncs)
+
+    tb.sim.run_until_complete(run())
+
+    # let the sink finish decoding the last word
+    tb.sim.run()
+
+    for word, is_cmd in zip(batch.words.tolist(), batch.syncs.tolist()):
+        data = word.to_bytes(2, byteorder="little")
+
+        if is_cmd:
+            assert data == tb.sink.read_nowait_cmd(), "RECEIVED CMD DOES NOT MATCH"
+        else:
+            assert data == tb.sink.read_nowait_data(), "RECEIVED DATA DOES NOT MATCH"
+
+    assert tb.sink.empty_cmd() and tb.sink.empty_data()
+
+# Function: test_virtual_wait_timeout
+# Tests the sink wait timeout and virtual time keeping.
+def test_virtual_wait_timeout():
+    tb = TB()
+
+    async def run():
+        await tb.sink.wait_cmd(timeout=5, timeout_unit='us')
+        return tb.sim.get_sim_time('us')
+
+    assert tb.sim.run_until_complete(run()) == 5
+
+# Function: test_virtual_first_cleanup
+# Tests repeated timeouts do not leave their callbacks waiting on the losing triggers.
+def test_virtual_first_cleanup():
+    tb = TB()
+
+    async def run():
+        for x in range(16):
+            await tb.sink.wait_cmd(timeout=1, timeout_unit='us')
+
+        await tb.sim.First(tb.sim.Timer(1, 'us'), tb.sim.Edge(tb.arstn))
+
+    tb.sim.run_until_complete(run())
+
+    assert not tb.sink.sync._waiters
+    assert not tb.arstn._waiters
+
+# Function: test_virtual_foreign_trigger
+# Tests a model awaiting a cocotb trigger instead of one from get_backend gets a TypeError.
+def test_virtual_foreign_trigger():
+    tb = TB()
+
+    async def run():
+        await NullTrigger()
+
+    with pytest.raises(TypeError, match="get_backend"):
+        tb.sim.run_until_complete(run())
+
+# Function: test_virtual_transactions
+# Tests concurrent writers each waiting only on their own pipelined words.
+def test_virtual_transactions():
+    tb = TB()
+
+    async def writer(first):
+        transactions = [tb.source.write_nowait_cmd((first + x).to_bytes(2, byteorder="little")) for x in range(4)]
+
+        for transaction in transactions:
+            await transaction
+
+        return transactions
+
+    async def run():
+        tasks = [tb.sim.start_soon(writer(first)) for first in (0x100, 0x200)]
+
+        return [await task for task in tasks]
+
+    results = tb.sim.run_until_complete(run())
+
+    transactions = sorted(results[0] + results[1], key=lambda transaction: transaction.start_time)
+
+    for transaction in transactions:
+        assert transaction.done() and transaction.sync == "CMD_SYNC"
+        assert transaction.end_time - transaction.start_time == 20000, "WORD IS NOT 20 BIT TIMES"
+
+    for previous, transaction in zip(transactions, transactions[1:]):
+        assert transaction.start_time == previous.end_time, "WORDS ARE NOT BACK TO BACK"
+
+    assert tb.source.idle()
+
+# Function: test_virtual_clear
+# Tests clear completes the queued transactions and wait returns once the source is idle.
+def test_virtual_clear():
+    tb = TB()
+
+    async def run():
+        await tb.sim.Timer(1, 'us')
+
+        transactions = [tb.source.write_nowait_cmd(x.to_bytes(2, byteorder="little")) for x in range(3)]
+
+        tb.source.clear()
+
+        await tb.source.wait()
+
+        return transactions
+
+    transactions = tb.sim.run_until_complete(run())
+
+    for transaction in transactions:
+        assert transaction.done() and transaction.end_time is None
+
+    assert tb.source.idle()
+
+# Function: test_virtual_profile
+# Tests trigger accounting and cProfile output of the source/sink run threads.
+def test_virtual_profile(tmp_path):
+    sim = VirtualSimulator()
+
+    data = sim.signal("data", 2)
+    arstn = sim.signal("arstn", 1, 1)
+
+    source = MILSTD1553Source(data, arstn, profile=True)
+    sink = MILSTD1553Sink(data, arstn, profile_dir=str(tmp_path))
+
+    async def run():
+        for x in range(4):
+            await source.write_data(x.to_bytes(2, byteorder="little"))
+            await sink.read_data()
+
+    sim.run_until_complete(run())
+
+    report = source.profile.report()
+
+    assert report["words"] == 4
+    # sync, 32 manchester half bits and 2 parity half bits of 500 ns each
+    assert report["triggers"]["Timer"] == 4 * (6 + 32 + 2)
+
+    assert sink.profile.report()["words"] == 4
+    assert sink.profile.triggers["Edge"] >= 4
+
+    assert sink.profile in profiling._pending
+
+    sink.profile.dump()
+
+    assert os.path.exists(sink.profile.path)
+
+    # dumped profiles are not written again at exit
+    assert sink.profile not in profiling._pending
+
+# Function: test_virtual_profile_exit
+# Tests a profile never dumped is still written at exit after its BFM has been collected.
+def test_virtual_profile_exit(tmp_path):
+    sim = VirtualSimulator()
+
+    data = sim.signal("data", 2)
+    arstn = sim.signal("arstn", 1, 1)
+
+    source = MILSTD1553Source(data, arstn, profile_dir=str(tmp_path))
+
+    async def run():
+        await source.write_data(bytes(2))
+
+    sim.run_until_complete(run())
+
+    path = source.profile.path
+
+    del source, sim, data, arstn
+    gc.collect()
+
+    profiling._dump_all()
+
+    assert os.path.exists(path)
+    assert not profiling._pending
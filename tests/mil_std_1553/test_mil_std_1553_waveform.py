@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+#******************************************************************************
+# file:    test_mil_std_1553_waveform.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2026/10/19
+#
+# about:   Brief
+# Simulator free tests of the mil-std-1553 waveform dump decoder
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import logging
+import os
+
+import numpy as np
+
+try:
+    from cocotbext.mil_std_1553 import MILSTD1553Source, MILSTD1553TrafficGenerator
+    from cocotbext.mil_std_1553.virtual import VirtualSimulator
+    from cocotbext.mil_std_1553.waveform import decode_changes, decode_waveform, read_capture, main, SYNC_CMD
+except ImportError as e:
+    import sys
+    sys.path.append("../../")
+    from cocotbext.mil_std_1553 import MILSTD1553Source, MILSTD1553TrafficGenerator
+    from cocotbext.mil_std_1553.virtual import VirtualSimulator
+    from cocotbext.mil_std_1553.waveform import decode_changes, decode_waveform, read_capture, main, SYNC_CMD
+
+# Function: write_vcd
+# Send batch with a source on a virtual bus and dump the bus to a vcd file.
+# A clock with clock_period in ps toggles in the dump and an instance below the bus has its own data port.
+# With initial False the bus has no value until its first change, so the dump starts with only clock changes.
+def write_vcd(path, batch, clock_period=1000000, initial=True):
+    sim = VirtualSimulator()
+
+    data = sim.signal("data", 2)
+    arstn = sim.signal("arstn", 1, 1)
+
+    source = MILSTD1553Source(data, arstn)
+
+    changes = []
+
+    async def dump():
+        while True:
+            await sim.Edge(data)
+            changes.append((sim.get_sim_time(), data.value.binstr))
+
+    async def run():
+        await sim.Timer(10, 'us')
+        await source.write_words(batch.words, batch.syncs)
+        await sim.Timer(10, 'us')
+
+    sim.start_soon(dump())
+    sim.run_until_complete(run())
+
+    end = sim.get_sim_time()
+
+    with open(path, "w") as f:
+        f.write("$timescale 1ps $end\n$scope module test_mil_std_1553 $end\n")
+        f.write("$var wire 1 # clk $end\n$var wire 2 ! data [1:0] $end\n$var wire 1 \" arstn $end\n")
+        f.write("$scope module ser $end\n$var wire 2 $ data [1:0] $end\n$upscope $end\n$upscope $end\n$enddefinitions $end\n")
+        f.write("#0\n$dumpvars\n" + ("b0 !\n" if initial else "") + "b0 $\n0#\n1\"\n$end\n")
+
+        clock = 0
+        edge = clock_period // 2
+
+        for time, value in changes + [(end, None)]:
+            while edge < time:
+                clock ^= 1
+                f.write(f"#{edge}\n{clock}#\n")
+                edge += clock_period // 2
+
+            if value is not None:
+                f.write(f"#{time}\nb{value} !\n")
+
+        f.write(f"#{end}\n")
+
+# Function: test_decode_waveform
+# Tests a dump decodes to the words that were sent, with words split over parse chunks.
+def test_decode_waveform(tmp_path):
+    batch = MILSTD1553TrafficGenerator(seed=1553).generate(32)
+
+    vcd = str(tmp_path / "test_mil_std_1553.vcd")
+
+    write_vcd(vcd, batch)
+
+    for block_size in [1024, 2**26]:
+        records = decode_waveform(vcd, "test_mil_std_1553.data", block_size=block_size)
+
+        assert list(records["word"]) == list(batch.words), "DECODED WORDS DO NOT MATCH"
+        assert list(records["sync"] == SYNC_CMD) == list(batch.syncs), "DECODED SYNCS DO NOT MATCH"
+        assert records["parity_ok"].all() and records["manchester_ok"].all()
+
+    capture = str(tmp_path / "test_mil_std_1553.m1553cap")
+
+    # the default signal name picks the bus over the data port of the instance below it
+    assert main([vcd, "-o", capture]) == 0
+
+    assert list(read_capture(capture)["word"]) == list(batch.words), "CAPTURE WORDS DO NOT MATCH"
+
+    assert main([vcd, "-o", capture, "-s", "missing"]) == 1
+    assert not os.path.exists(capture)
+
+# Function: test_decode_bus_free_chunk
+# Tests chunks without any bus change, at the start of a dump or as an empty change array.
+def test_decode_bus_free_chunk(tmp_path):
+    records, after = decode_changes(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int8), 100)
+
+    assert not len(records) and after == -1
+
+    batch = MILSTD1553TrafficGenerator(seed=1553).generate(4)
+
+    vcd = str(tmp_path / "test_mil_std_1553.vcd")
+
+    write_vcd(vcd, batch, clock_period=100000, initial=False)
+
+    records = decode_waveform(vcd, "test_mil_std_1553.data", block_size=256)
+
+    assert list(records["word"]) == list(batch.words), "DECODED WORDS DO NOT MATCH"